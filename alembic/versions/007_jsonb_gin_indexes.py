@@ -0,0 +1,44 @@
+"""add gin indexes on jsonb error columns
+
+Revision ID: 007
+Revises: 006
+Create Date: 2025-01-20 11:00:00.000000
+
+"""
+from alembic import op
+
+
+revision = '007'
+down_revision = '006'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.create_index(
+        'ix_validation_results_errors_gin',
+        'validation_results',
+        ['errors'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'errors': 'jsonb_path_ops'}
+    )
+    op.create_index(
+        'ix_quality_metrics_top_errors_gin',
+        'quality_metrics',
+        ['top_errors'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'top_errors': 'jsonb_path_ops'}
+    )
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.drop_index('ix_quality_metrics_top_errors_gin', 'quality_metrics')
+    op.drop_index('ix_validation_results_errors_gin', 'validation_results')
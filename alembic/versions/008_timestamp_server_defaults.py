@@ -0,0 +1,53 @@
+"""add server defaults to timestamp columns
+
+Revision ID: 008
+Revises: 007
+Create Date: 2025-01-21 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = '008'
+down_revision = '007'
+branch_labels = None
+depends_on = None
+
+
+TIMESTAMP_COLUMNS = [
+    ('contracts', 'created_at'),
+    ('contracts', 'updated_at'),
+    ('contract_versions', 'created_at'),
+    ('validation_results', 'validated_at'),
+    ('quality_metrics', 'created_at'),
+    ('batch_summaries', 'processed_at'),
+]
+
+
+def upgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    for table, column in TIMESTAMP_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            existing_type=sa.DateTime(),
+            existing_nullable=False,
+            server_default=sa.text("TIMEZONE('utc', CURRENT_TIMESTAMP)")
+        )
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    for table, column in TIMESTAMP_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            existing_type=sa.DateTime(),
+            existing_nullable=False,
+            server_default=None
+        )
@@ -0,0 +1,70 @@
+"""store ids as native uuid on postgres
+
+Revision ID: 009
+Revises: 008
+Create Date: 2025-01-21 11:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision = '009'
+down_revision = '008'
+branch_labels = None
+depends_on = None
+
+
+FOREIGN_KEYS = [
+    ('contract_versions_contract_id_fkey', 'contract_versions', None),
+    ('validation_results_contract_id_fkey', 'validation_results', None),
+    ('quality_metrics_contract_id_fkey', 'quality_metrics', None),
+    ('batch_summaries_contract_id_fkey', 'batch_summaries', 'CASCADE'),
+]
+
+UUID_COLUMNS = [
+    ('contracts', 'id'),
+    ('contract_versions', 'id'),
+    ('contract_versions', 'contract_id'),
+    ('validation_results', 'id'),
+    ('validation_results', 'contract_id'),
+    ('validation_results', 'batch_id'),
+    ('quality_metrics', 'id'),
+    ('quality_metrics', 'contract_id'),
+    ('batch_summaries', 'id'),
+    ('batch_summaries', 'batch_id'),
+    ('batch_summaries', 'contract_id'),
+]
+
+
+def _convert(type_, cast):
+    for name, table, _ in FOREIGN_KEYS:
+        op.drop_constraint(name, table, type_='foreignkey')
+
+    for table, column in UUID_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=type_,
+            postgresql_using=f'{column}::{cast}'
+        )
+
+    for name, table, ondelete in FOREIGN_KEYS:
+        op.create_foreign_key(
+            name, table, 'contracts', ['contract_id'], ['id'], ondelete=ondelete
+        )
+
+
+def upgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    _convert(postgresql.UUID(as_uuid=False), 'uuid')
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    _convert(sa.String(36), 'varchar(36)')
@@ -0,0 +1,39 @@
+"""add generated total_changes column to contract versions
+
+Revision ID: 010
+Revises: 009
+Create Date: 2025-01-22 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = '010'
+down_revision = '009'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.add_column(
+        'contract_versions',
+        sa.Column(
+            'total_changes',
+            sa.Integer(),
+            sa.Computed("((change_summary ->> 'total_changes')::integer)", persisted=True),
+            nullable=True
+        )
+    )
+    op.create_index('ix_contract_versions_total_changes', 'contract_versions', ['total_changes'], unique=False)
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.drop_index('ix_contract_versions_total_changes', 'contract_versions')
+    op.drop_column('contract_versions', 'total_changes')
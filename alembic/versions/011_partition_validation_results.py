@@ -0,0 +1,110 @@
+"""partition validation results by month
+
+Revision ID: 011
+Revises: 010
+Create Date: 2025-01-22 11:00:00.000000
+
+"""
+from datetime import date, datetime
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = '011'
+down_revision = '010'
+branch_labels = None
+depends_on = None
+
+
+MONTHS_AHEAD = 3
+
+
+def _add_months(value, months):
+    month_index = value.year * 12 + value.month - 1 + months
+    return date(month_index // 12, month_index % 12 + 1, 1)
+
+
+def _create_indexes():
+    op.create_foreign_key(
+        'validation_results_contract_id_fkey',
+        'validation_results', 'contracts', ['contract_id'], ['id']
+    )
+    op.create_index('ix_validation_results_batch_id', 'validation_results', ['batch_id'], unique=False)
+    op.create_index('ix_validation_results_contract_date', 'validation_results', ['contract_id', 'validated_at'], unique=False)
+    op.create_index('ix_validation_results_contract_id', 'validation_results', ['contract_id'], unique=False)
+    op.create_index('ix_validation_results_status', 'validation_results', ['status'], unique=False)
+    op.create_index('ix_validation_results_validated_at', 'validation_results', ['validated_at'], unique=False)
+    op.create_index(
+        'ix_validation_results_errors_gin',
+        'validation_results',
+        ['errors'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'errors': 'jsonb_path_ops'}
+    )
+
+
+def upgrade():
+    conn = op.get_bind()
+    if conn.dialect.name != 'postgresql':
+        return
+
+    oldest = conn.execute(sa.text('SELECT MIN(validated_at) FROM validation_results')).scalar()
+    today = datetime.utcnow().date()
+    month = date((oldest or today).year, (oldest or today).month, 1)
+    last = _add_months(date(today.year, today.month, 1), MONTHS_AHEAD)
+
+    op.execute(
+        'CREATE TABLE validation_results_new '
+        '(LIKE validation_results INCLUDING DEFAULTS) '
+        'PARTITION BY RANGE (validated_at)'
+    )
+    op.execute(
+        'ALTER TABLE validation_results_new '
+        'ADD CONSTRAINT validation_results_new_pkey PRIMARY KEY (id, validated_at)'
+    )
+
+    while month <= last:
+        op.execute(
+            f"CREATE TABLE validation_results_{month:%Y_%m} "
+            f"PARTITION OF validation_results_new "
+            f"FOR VALUES FROM ('{month}') TO ('{_add_months(month, 1)}')"
+        )
+        month = _add_months(month, 1)
+
+    op.execute(
+        'CREATE TABLE validation_results_default '
+        'PARTITION OF validation_results_new DEFAULT'
+    )
+
+    op.execute('INSERT INTO validation_results_new SELECT * FROM validation_results')
+    op.execute('DROP TABLE validation_results')
+    op.execute('ALTER TABLE validation_results_new RENAME TO validation_results')
+    op.execute(
+        'ALTER TABLE validation_results '
+        'RENAME CONSTRAINT validation_results_new_pkey TO validation_results_pkey'
+    )
+    _create_indexes()
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.execute(
+        'CREATE TABLE validation_results_old '
+        '(LIKE validation_results INCLUDING DEFAULTS)'
+    )
+    op.execute(
+        'ALTER TABLE validation_results_old '
+        'ADD CONSTRAINT validation_results_old_pkey PRIMARY KEY (id)'
+    )
+    op.execute('INSERT INTO validation_results_old SELECT * FROM validation_results')
+    op.execute('DROP TABLE validation_results CASCADE')
+    op.execute('ALTER TABLE validation_results_old RENAME TO validation_results')
+    op.execute(
+        'ALTER TABLE validation_results '
+        'RENAME CONSTRAINT validation_results_old_pkey TO validation_results_pkey'
+    )
+    _create_indexes()
@@ -1,15 +1,19 @@
 from typing import Optional
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, Query, Path, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Path, Response, status
 from sqlalchemy.orm import Session
 
 from app.database import get_db
 from app.core.contract_manager import ContractManager
+from app.core.yaml_parser import YAMLParser
 from app.models.schemas import (
     ContractCreate,
     ContractUpdate,
     ContractResponse,
     ContractList,
+    ContractSummary,
+    CONTRACT_LIST_ADAPTER,
+    ContractSummaryList,
 )
 from app.utils.exceptions import (
     DCEBaseException,
@@ -37,7 +41,7 @@ def create_contract(contract_data: ContractCreate, db: Session = Depends(get_db)
         manager = ContractManager(db)
         contract = manager.create_contract(contract_data)
 
-        return ContractResponse.from_db_model(contract)
+        return ContractResponse.model_validate(contract)
 
     except DuplicateContractError as e:
         logger.warning(f"Duplicate contract: {contract_data.name}")
@@ -78,7 +82,9 @@ def list_contracts(
             domain=domain, is_active=is_active, skip=skip, limit=limit
         )
 
-        contract_responses = [ContractResponse.from_db_model(c) for c in contracts]
+        contract_responses = CONTRACT_LIST_ADAPTER.validate_python(
+            contracts, from_attributes=True
+        )
 
         response = ContractList.paginate(
             contracts=contract_responses, total=total, skip=skip, limit=limit
@@ -93,6 +99,39 @@ def list_contracts(
         )
 
 
+@router.get("/summaries", response_model=ContractSummaryList)
+def list_contract_summaries(
+    domain: Optional[str] = Query(None, description="Filter by domain"),
+    is_active: bool = Query(True, description="Filter by active status"),
+    skip: int = Query(0, ge=0, description="Number of records to skip"),
+    limit: int = Query(50, ge=1, le=100, description="Maximum records to return"),
+    db: Session = Depends(get_db),
+):
+    logger.info(
+        f"GET /contracts/summaries - domain={domain}, active={is_active}, "
+        f"skip={skip}, limit={limit}"
+    )
+
+    try:
+        manager = ContractManager(db)
+        summaries, total = manager.list_contract_summaries(
+            domain=domain, is_active=is_active, skip=skip, limit=limit
+        )
+
+        return ContractSummaryList.paginate(
+            contracts=[ContractSummary.model_validate(s) for s in summaries],
+            total=total,
+            skip=skip,
+            limit=limit,
+        )
+
+    except Exception as e:
+        logger.error(f"Failed to list contract summaries: {str(e)}", exc_info=True)
+        raise HTTPException(
+            status_code=500, detail={"error": "InternalServerError", "message": str(e)}
+        )
+
+
 @router.get("/{contract_id}", response_model=ContractResponse)
 def get_contract_by_id(
     contract_id: UUID = Path(..., description="Contract UUID"),
@@ -107,7 +146,7 @@ def get_contract_by_id(
         if not contract:
             raise ContractNotFoundError(contract_id=str(contract_id))
 
-        return ContractResponse.from_db_model(contract)
+        return ContractResponse.model_validate(contract)
 
     except ContractNotFoundError as e:
         raise HTTPException(status_code=e.status_code, detail=e.to_dict())
@@ -119,6 +158,40 @@ def get_contract_by_id(
         )
 
 
+@router.get("/{contract_id}/export")
+def export_contract(
+    contract_id: UUID = Path(..., description="Contract UUID"),
+    format: str = Query("yaml", pattern="^(yaml|json)$", description="yaml or json"),
+    db: Session = Depends(get_db),
+):
+    logger.info(f"GET /contracts/{contract_id}/export?format={format}")
+
+    try:
+        manager = ContractManager(db)
+
+        if format == "json":
+            contract_schema = manager.get_contract_schema(contract_id)
+            return Response(
+                content=YAMLParser().serialize_to_json(contract_schema),
+                media_type="application/json",
+            )
+
+        contract = manager.get_contract_by_id(contract_id)
+        if not contract:
+            raise ContractNotFoundError(contract_id=str(contract_id))
+
+        return Response(content=contract.yaml_content, media_type="application/x-yaml")
+
+    except (ContractNotFoundError, InvalidYAMLError) as e:
+        raise HTTPException(status_code=e.status_code, detail=e.to_dict())
+
+    except Exception as e:
+        logger.error(f"Failed to export contract: {str(e)}", exc_info=True)
+        raise HTTPException(
+            status_code=500, detail={"error": "InternalServerError", "message": str(e)}
+        )
+
+
 @router.get("/by-name/{name}", response_model=ContractResponse)
 def get_contract_by_name(
     name: str = Path(..., description="Contract name"), db: Session = Depends(get_db)
@@ -138,7 +211,7 @@ def get_contract_by_name(
                 },
             )
 
-        return ContractResponse.from_db_model(contract)
+        return ContractResponse.model_validate(contract)
 
     except HTTPException:
         raise
@@ -164,7 +237,7 @@ def update_contract(
         )
 
         return {
-            "contract": ContractResponse.from_db_model(contract),
+            "contract": ContractResponse.model_validate(contract),
             "change_report": change_report,
         }
 
@@ -232,7 +305,7 @@ def activate_contract(
         manager = ContractManager(db)
         contract = manager.activate_contract(contract_id)
 
-        return ContractResponse.from_db_model(contract)
+        return ContractResponse.model_validate(contract)
 
     except ContractNotFoundError as e:
         raise HTTPException(status_code=e.status_code, detail=e.to_dict())
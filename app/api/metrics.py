@@ -5,6 +5,7 @@ from datetime import date, timedelta
 
 from app.database import get_db
 from app.core.metrics_aggregator import MetricsAggregator
+from app.core.yaml_parser import parse_cache, serialize_cache
 from app.models.schemas import DailyMetrics
 from app.models.database import Contract, QualityMetric
 from app.utils.exceptions import ContractNotFoundError
@@ -172,6 +173,14 @@ async def get_platform_summary(db: Session = Depends(get_db)):
     }
 
 
+@router.get("/cache")
+async def get_cache_stats():
+    return {
+        "yaml_parser": parse_cache.stats(),
+        "yaml_serializer": serialize_cache.stats(),
+    }
+
+
 @router.get("/{contract_id}/quality-score")
 async def get_quality_score(
     contract_id: UUID, days: int = Query(7, ge=1, le=90), db: Session = Depends(get_db)
@@ -8,26 +8,59 @@ from fastapi import (
     Form,
     BackgroundTasks,
 )
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 from typing import Optional
 from datetime import datetime
 from uuid import UUID
-import uuid
 import tempfile
+import shutil
 import os
 
 from app.database import get_db
+from app.core.batch_processor import BatchProcessor
+from app.core.contract_manager import ContractManager
 from app.core.validation_engine import ValidationEngine
 from app.models.schemas import (
     ValidationRequest,
     ValidationResult,
     BatchValidationResult,
+    BatchProcessingResult,
     ValidationHistoryResponse,
 )
-from app.models.database import ValidationResult as DBValidationResult, BatchSummary
+from app.models.database import (
+    ValidationResult as DBValidationResult,
+    BatchSummary,
+    uuid7,
+)
+from app.utils.exceptions import ContractNotFoundError, DCEBaseException
 
 router = APIRouter(prefix="/validate", tags=["validation"])
 
+MAX_UPLOAD_BYTES = 100 * 1024 * 1024
+BATCH_FILE_TYPES = ("csv", "json", "jsonl")
+UPLOAD_FILE_TYPES = ("csv", "json", "parquet")
+
+
+def _check_upload(file: UploadFile, file_type: str, allowed_types: tuple) -> None:
+    if file.size is not None and file.size > MAX_UPLOAD_BYTES:
+        raise HTTPException(status_code=413, detail="File too large (max 100MB)")
+
+    if file_type not in allowed_types:
+        raise HTTPException(
+            status_code=422,
+            detail=(
+                f"Unsupported file type. Must be {', '.join(allowed_types[:-1])}, "
+                f"or {allowed_types[-1]}"
+            ),
+        )
+
+
+def _save_upload(file: UploadFile, file_type: str) -> str:
+    with tempfile.NamedTemporaryFile(delete=False, suffix=f".{file_type}") as tmp_file:
+        shutil.copyfileobj(file.file, tmp_file)
+        return tmp_file.name
+
 
 @router.post("/{contract_id}", response_model=ValidationResult)
 async def validate_record(
@@ -71,6 +104,37 @@ async def validate_batch(
         raise HTTPException(status_code=500, detail=f"Batch validation error: {str(e)}")
 
 
+@router.post("/{contract_id}/batch/file", response_model=BatchProcessingResult)
+async def validate_batch_file(
+    contract_id: UUID,
+    file: UploadFile = File(...),
+    file_type: str = Form(...),
+    db: Session = Depends(get_db),
+):
+    _check_upload(file, file_type, BATCH_FILE_TYPES)
+
+    try:
+        if not ContractManager(db).get_contract_by_id(contract_id):
+            raise ContractNotFoundError(contract_id=str(contract_id))
+    except DCEBaseException as e:
+        raise HTTPException(status_code=e.status_code, detail=e.to_dict())
+
+    tmp_path = await run_in_threadpool(_save_upload, file, file_type)
+    try:
+        processor = BatchProcessor(db)
+        return await processor.process_file(
+            contract_id=contract_id, file_path=tmp_path, file_type=file_type
+        )
+    except DCEBaseException as e:
+        raise HTTPException(status_code=e.status_code, detail=e.to_dict())
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"Invalid file: {str(e)}")
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Batch validation error: {str(e)}")
+    finally:
+        os.unlink(tmp_path)
+
+
 @router.get("/{contract_id}/results", response_model=ValidationHistoryResponse)
 def get_validation_history(
     contract_id: UUID,
@@ -82,7 +146,7 @@ def get_validation_history(
     db: Session = Depends(get_db),
 ):
     try:
-        query = db.query(DBValidationResult).filter(
+        query = db.query(*DBValidationResult.__table__.columns).filter(
             DBValidationResult.contract_id == str(contract_id)
         )
 
@@ -105,7 +169,7 @@ def get_validation_history(
         )
 
         return ValidationHistoryResponse(
-            results=[r.to_dict() for r in results],
+            results=[DBValidationResult.row_to_dict(r) for r in results],
             total=total,
             filters_applied={
                 "status": status,
@@ -185,21 +249,10 @@ async def upload_file_for_validation(
     file_type: str = Form(...),
     db: Session = Depends(get_db),
 ):
-    if file.size > 100 * 1024 * 1024:
-        raise HTTPException(status_code=413, detail="File too large (max 100MB)")
+    _check_upload(file, file_type, UPLOAD_FILE_TYPES)
 
-    if file_type not in ["csv", "json", "parquet"]:
-        raise HTTPException(
-            status_code=422,
-            detail="Unsupported file type. Must be csv, json, or parquet",
-        )
-
-    batch_id = uuid.uuid4()
-
-    with tempfile.NamedTemporaryFile(delete=False, suffix=f".{file_type}") as tmp_file:
-        content = await file.read()
-        tmp_file.write(content)
-        tmp_path = tmp_file.name
+    batch_id = uuid7()
+    tmp_path = await run_in_threadpool(_save_upload, file, file_type)
 
     background_tasks.add_task(
         process_file_background, contract_id, tmp_path, file_type, batch_id
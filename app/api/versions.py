@@ -162,7 +162,7 @@ def rollback_contract(
         )
 
         return RollbackResponse(
-            contract=ContractResponse.from_db_model(contract),
+            contract=ContractResponse.model_validate(contract),
             new_version=contract.version,
             rolled_back_to=request.target_version,
             message=f"Successfully rolled back to version {request.target_version}",
@@ -8,6 +8,7 @@ class Settings(BaseSettings):
     ENV: str = "development"
     DEBUG: bool = True
     LOG_LEVEL: str = "debug"
+    SQL_ECHO: bool = False
 
     # API
     API_V1_PREFIX: str = "/api/v1"
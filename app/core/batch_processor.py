@@ -1,12 +1,12 @@
 from typing import Dict, List, Optional, Callable
 from uuid import UUID
-import uuid
 import time
 import logging
 from datetime import datetime
 from sqlalchemy.orm import Session
 from app.core.file_handlers import FileHandlerFactory
 from app.core.validation_engine import ValidationEngine
+from app.models.database import uuid7
 from app.models.schemas import BatchProcessingResult
 from app.utils.exceptions import InvalidFileFormatError
 
@@ -27,7 +27,7 @@ class BatchProcessor:
         batch_id: Optional[UUID] = None,
     ) -> BatchProcessingResult:
         if batch_id is None:
-            batch_id = uuid.uuid4()
+            batch_id = uuid7()
 
         start_time = time.time()
 
@@ -35,7 +35,7 @@ class BatchProcessor:
         validation_engine = ValidationEngine(self.db)
 
         if not handler.validate_format(file_path):
-            raise InvalidFileFormatError(f"Invalid {file_type} format")
+            raise InvalidFileFormatError(file_type, "file could not be parsed")
 
         total_records = 0
         passed_records = 0
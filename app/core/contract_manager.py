@@ -2,8 +2,8 @@ import logging
 from typing import Optional, List, Tuple
 from uuid import UUID
 from datetime import datetime, timezone
-from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy.orm import Session, raiseload
+from sqlalchemy import Row, and_
 
 from app.models.database import Contract, ContractVersion
 from app.models.schemas import ContractCreate, ContractUpdate, ContractSchema
@@ -110,6 +110,14 @@ class ContractManager:
 
         return contract
 
+    def _contracts_query(self, query, domain: Optional[str], is_active: bool):
+        filters = [Contract.is_active == is_active]
+
+        if domain:
+            filters.append(Contract.domain == domain)
+
+        return query.filter(and_(*filters))
+
     def list_contracts(
         self,
         domain: Optional[str] = None,
@@ -117,14 +125,11 @@ class ContractManager:
         skip: int = 0,
         limit: int = 50,
     ) -> Tuple[List[Contract], int]:
-        query = self.db.query(Contract)
-
-        filters = [Contract.is_active == is_active]
-
-        if domain:
-            filters.append(Contract.domain == domain)
-
-        query = query.filter(and_(*filters))
+        # List responses only use scalar columns; fail loudly instead of
+        # lazy-loading relationships once per listed contract.
+        query = self._contracts_query(
+            self.db.query(Contract).options(raiseload("*")), domain, is_active
+        )
 
         total = query.count()
 
@@ -139,6 +144,34 @@ class ContractManager:
 
         return contracts, total
 
+    def list_contract_summaries(
+        self,
+        domain: Optional[str] = None,
+        is_active: bool = True,
+        skip: int = 0,
+        limit: int = 50,
+    ) -> Tuple[List[Row], int]:
+        query = self._contracts_query(
+            self.db.query(
+                Contract.id,
+                Contract.name,
+                Contract.version,
+                Contract.domain,
+                Contract.is_active,
+                Contract.updated_at,
+            ),
+            domain,
+            is_active,
+        )
+
+        total = query.count()
+
+        summaries = (
+            query.order_by(Contract.updated_at.desc()).offset(skip).limit(limit).all()
+        )
+
+        return summaries, total
+
     def update_contract(
         self, contract_id: UUID, update_data: ContractUpdate
     ) -> Tuple[Contract, dict]:
@@ -253,6 +286,22 @@ class ContractManager:
                 error_message=str(e), details={"contract_id": str(contract_id)}
             )
 
+    def get_contract_with_schema(
+        self, contract_id: UUID
+    ) -> Optional[Tuple[Contract, ContractSchema]]:
+        contract = self.get_contract_by_id(contract_id)
+        if not contract:
+            return None
+
+        try:
+            schema = self.yaml_parser.parse_yaml(contract.yaml_content)
+        except YAMLParserError as e:
+            raise InvalidYAMLError(
+                error_message=str(e), details={"contract_id": str(contract_id)}
+            )
+
+        return contract, schema
+
     def get_domains(self) -> List[str]:
         domains = self.db.query(Contract.domain).distinct().all()
         return [d[0] for d in domains if d[0]]
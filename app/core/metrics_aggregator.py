@@ -1,7 +1,10 @@
 from typing import List, Dict, Optional
 from uuid import UUID
 from datetime import date, datetime, timedelta
+import heapq
 import logging
+from operator import itemgetter
+from sqlalchemy import case, func
 from sqlalchemy.orm import Session
 
 from app.models.database import ValidationResult, Contract, QualityMetric
@@ -20,33 +23,41 @@ class MetricsAggregator:
         start_datetime = datetime.combine(target_date, datetime.min.time())
         end_datetime = datetime.combine(target_date, datetime.max.time())
 
-        validations = (
-            self.db.query(ValidationResult)
-            .filter(
-                ValidationResult.contract_id == str(contract_id),
-                ValidationResult.validated_at >= start_datetime,
-                ValidationResult.validated_at < end_datetime,
+        in_window = (
+            ValidationResult.contract_id == str(contract_id),
+            ValidationResult.validated_at >= start_datetime,
+            ValidationResult.validated_at < end_datetime,
+        )
+
+        total, passed, avg_execution_time = (
+            self.db.query(
+                func.count(),
+                func.sum(case((ValidationResult.status == "PASS", 1), else_=0)),
+                func.avg(ValidationResult.execution_time_ms),
             )
-            .all()
+            .filter(*in_window)
+            .one()
         )
 
-        if not validations:
+        if not total:
             return self._create_empty_metrics(contract_id, target_date)
 
-        total = len(validations)
-        passed = sum(1 for v in validations if v.status == "PASS")
         failed = total - passed
-        pass_rate = (passed / total * 100) if total > 0 else 0
+        pass_rate = passed / total * 100
 
-        avg_execution_time = sum(v.execution_time_ms for v in validations) / total
+        failed_errors = (
+            self.db.query(ValidationResult.errors)
+            .filter(*in_window, ValidationResult.status == "FAIL")
+            .all()
+        )
 
         all_errors = []
-        for v in validations:
-            if v.status == "FAIL" and v.errors:
-                all_errors.extend(v.errors)
+        for (errors,) in failed_errors:
+            if errors:
+                all_errors.extend(errors)
 
         error_counts = self._count_errors(all_errors)
-        top_errors = sorted(error_counts.items(), key=lambda x: x[1], reverse=True)[:10]
+        top_errors = heapq.nlargest(10, error_counts.items(), key=itemgetter(1))
 
         quality_score = self._calculate_quality_score(
             pass_rate=pass_rate,
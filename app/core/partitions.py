@@ -0,0 +1,130 @@
+import logging
+from datetime import date, datetime
+from typing import List, Optional
+
+from sqlalchemy import text
+
+
+logger = logging.getLogger(__name__)
+
+PARTITIONED_TABLE = "validation_results"
+PARTITION_MONTHS_AHEAD = 3
+# Catches rows for months that have no partition yet, e.g. if the monthly
+# job has not run; ensure_partitions moves them out once their month exists.
+DEFAULT_PARTITION = f"{PARTITIONED_TABLE}_default"
+
+
+def month_start(value: date) -> date:
+    return date(value.year, value.month, 1)
+
+
+def add_months(value: date, months: int) -> date:
+    month_index = value.year * 12 + value.month - 1 + months
+    return date(month_index // 12, month_index % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    return f"{PARTITIONED_TABLE}_{month:%Y_%m}"
+
+
+def ensure_partitions(
+    bind, months_ahead: int = PARTITION_MONTHS_AHEAD, today: Optional[date] = None
+) -> List[str]:
+    if bind.dialect.name != "postgresql":
+        return []
+
+    current = month_start(today or datetime.utcnow().date())
+    names = []
+
+    with bind.begin() as conn:
+        conn.execute(
+            text(
+                f"CREATE TABLE IF NOT EXISTS {DEFAULT_PARTITION} "
+                f"PARTITION OF {PARTITIONED_TABLE} DEFAULT"
+            )
+        )
+        for offset in range(months_ahead + 1):
+            month = add_months(current, offset)
+            names.append(_create_month_partition(conn, month))
+
+    logger.info(f"Ensured {PARTITIONED_TABLE} partitions through {names[-1]}")
+    return names
+
+
+def _create_month_partition(conn, month: date) -> str:
+    name = partition_name(month)
+    if conn.execute(text("SELECT to_regclass(:name)"), {"name": name}).scalar():
+        return name
+
+    create = text(
+        f"CREATE TABLE {name} PARTITION OF {PARTITIONED_TABLE} "
+        f"FOR VALUES FROM ('{month}') TO ('{add_months(month, 1)}')"
+    )
+    in_month = "validated_at >= :start AND validated_at < :end"
+    bounds = {"start": month, "end": add_months(month, 1)}
+    stranded = conn.execute(
+        text(f"SELECT EXISTS (SELECT 1 FROM {DEFAULT_PARTITION} WHERE {in_month})"),
+        bounds,
+    ).scalar()
+
+    if not stranded:
+        conn.execute(create)
+        return name
+
+    # Postgres refuses to add a partition whose range already has rows in the
+    # default partition, so move them across while the default is detached.
+    logger.warning(f"Moving {name} rows out of {DEFAULT_PARTITION}")
+    conn.execute(
+        text(f"ALTER TABLE {PARTITIONED_TABLE} DETACH PARTITION {DEFAULT_PARTITION}")
+    )
+    conn.execute(create)
+    conn.execute(
+        text(
+            f"INSERT INTO {PARTITIONED_TABLE} "
+            f"SELECT * FROM {DEFAULT_PARTITION} WHERE {in_month}"
+        ),
+        bounds,
+    )
+    conn.execute(text(f"DELETE FROM {DEFAULT_PARTITION} WHERE {in_month}"), bounds)
+    conn.execute(
+        text(
+            f"ALTER TABLE {PARTITIONED_TABLE} "
+            f"ATTACH PARTITION {DEFAULT_PARTITION} DEFAULT"
+        )
+    )
+    return name
+
+
+def drop_expired_partitions(bind, cutoff: datetime) -> List[str]:
+    if bind.dialect.name != "postgresql":
+        return []
+
+    prefix = f"{PARTITIONED_TABLE}_"
+    cutoff_month = month_start(cutoff.date())
+    dropped = []
+
+    with bind.begin() as conn:
+        children = conn.execute(
+            text(
+                "SELECT c.relname FROM pg_inherits i "
+                "JOIN pg_class c ON c.oid = i.inhrelid "
+                "JOIN pg_class p ON p.oid = i.inhparent "
+                "WHERE p.relname = :parent"
+            ),
+            {"parent": PARTITIONED_TABLE},
+        ).scalars()
+
+        for name in children:
+            try:
+                month = datetime.strptime(name[len(prefix) :], "%Y_%m").date()
+            except ValueError:
+                continue
+
+            # Only whole months that end on or before the cutoff.
+            if add_months(month, 1) <= cutoff_month:
+                conn.execute(text(f"DROP TABLE {name}"))
+                dropped.append(name)
+
+    if dropped:
+        logger.info(f"Dropped expired partitions: {', '.join(dropped)}")
+    return dropped
@@ -185,19 +185,23 @@ class QualityValidator:
         errors = []
         stats_rules = self.rules["statistics"]
 
+        import numpy as np
+
         for field, constraints in stats_rules.items():
-            values = [
-                record.get(field)
-                for record in data
-                if field in record and isinstance(record.get(field), (int, float))
-            ]
+            values = np.fromiter(
+                (
+                    value
+                    for value in (record.get(field) for record in data)
+                    if isinstance(value, (int, float))
+                ),
+                dtype=float,
+            )
 
-            if not values:
+            if not values.size:
                 continue
 
-            mean = sum(values) / len(values)
-            variance = sum((x - mean) ** 2 for x in values) / len(values)
-            std_dev = variance**0.5
+            mean = float(values.mean())
+            std_dev = float(values.std())
 
             if "mean" in constraints:
                 mean_constraints = constraints["mean"]
@@ -1,342 +1,375 @@
 import re
 import logging
-from typing import Dict, Any, List, Optional, Union
+from typing import Dict, Any, FrozenSet, List, Optional, Pattern, Tuple, Union
 from datetime import datetime
-from functools import lru_cache
 
 from app.models.schemas import ContractSchema, FieldDefinition, ValidationError
+from app.utils.cache import compile_pattern
+
+# (field, error_type, raw value, context). Message/expected strings are only
+# rendered by to_validation_error, so errors that get dropped never pay for it.
+_ErrorTuple = Tuple[str, str, Any, Any]
+
+
+def _render_required(field, value, ctx):
+    if ctx is None:
+        return f"Required field '{field}' is missing", "required field"
+    return f"Required property '{ctx}' is missing", "required property"
+
+
+def _render_invalid_timestamp(field, value, ctx):
+    if ctx is None:
+        return "Cannot parse timestamp", "ISO 8601 or Unix timestamp"
+    return f"Cannot parse timestamp: {str(ctx)}", "Valid timestamp"
+
+
+_MESSAGE_RENDERERS = {
+    "REQUIRED_FIELD_MISSING": _render_required,
+    "TYPE_MISMATCH": lambda f, v, t: (f"Expected {t}, got {type(v).__name__}", t),
+    "PATTERN_MISMATCH": lambda f, v, d: (
+        f"Value does not match pattern: {d.pattern}",
+        d.pattern,
+    ),
+    "FORMAT_MISMATCH": lambda f, v, d: (
+        f"Value does not match format: {d.format}",
+        d.format,
+    ),
+    "LENGTH_TOO_SHORT": lambda f, v, d: (
+        f"Length {len(v)} is less than minimum {d.min_length}",
+        f"min_length: {d.min_length}",
+    ),
+    "LENGTH_TOO_LONG": lambda f, v, d: (
+        f"Length {len(v)} exceeds maximum {d.max_length}",
+        f"max_length: {d.max_length}",
+    ),
+    "ENUM_MISMATCH": lambda f, v, d: (
+        f"Value not in allowed list: {d.enum}",
+        str(d.enum),
+    ),
+    "VALUE_TOO_SMALL": lambda f, v, d: (
+        f"Value {v} is less than minimum {d.min}",
+        f"min: {d.min}",
+    ),
+    "VALUE_TOO_LARGE": lambda f, v, d: (
+        f"Value {v} exceeds maximum {d.max}",
+        f"max: {d.max}",
+    ),
+    "TIMESTAMP_TOO_OLD": lambda f, v, d: (
+        f"Timestamp before minimum: {d.min}",
+        f"min: {d.min}",
+    ),
+    "TIMESTAMP_TOO_RECENT": lambda f, v, d: (
+        f"Timestamp after maximum: {d.max}",
+        f"max: {d.max}",
+    ),
+    "INVALID_TIMESTAMP": _render_invalid_timestamp,
+    "ARRAY_TOO_SHORT": lambda f, v, d: (
+        f"Array length {len(v)} less than minimum {d.min}",
+        f"min: {d.min}",
+    ),
+    "ARRAY_TOO_LONG": lambda f, v, d: (
+        f"Array length {len(v)} exceeds maximum {d.max}",
+        f"max: {d.max}",
+    ),
+}
+
+_ARRAY_ERROR_TYPES = frozenset({"ARRAY_TOO_SHORT", "ARRAY_TOO_LONG"})
+
+_MISSING = object()
+
+_TYPE_CHECKS = {
+    "string": lambda v: isinstance(v, str),
+    "integer": lambda v: isinstance(v, int) and not isinstance(v, bool),
+    "float": lambda v: isinstance(v, (int, float)) and not isinstance(v, bool),
+    "boolean": lambda v: isinstance(v, bool),
+    "timestamp": lambda v: isinstance(v, (str, int, float, datetime)),
+    "date": lambda v: isinstance(v, str),
+    "array": lambda v: isinstance(v, list),
+    "object": lambda v: isinstance(v, dict),
+}
+
+_FORMAT_PATTERNS = {
+    "email": re.compile(
+        r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$", re.IGNORECASE
+    ),
+    "url": re.compile(r"^https?://[^\s/$.?#].[^\s]*$", re.IGNORECASE),
+    "uuid": re.compile(r"^[0-9a-f]{8}-([0-9a-f]{4}-){3}[0-9a-f]{12}$", re.IGNORECASE),
+    "ipv4": re.compile(
+        r"^((25[0-5]|2[0-4][0-9]|1[0-9][0-9]|[1-9]?[0-9])\.){3}(25[0-5]|2[0-4][0-9]|1[0-9][0-9]|[1-9]?[0-9])$",
+        re.IGNORECASE,
+    ),
+}
+
+
+def _mk_err(
+    field: str, error_type: str, message: str, value: Any, expected: Any
+) -> ValidationError:
+    # Inputs are produced internally, so skip pydantic's field validation.
+    return ValidationError.model_construct(
+        field=field,
+        error_type=error_type,
+        message=message,
+        value=value,
+        expected=expected,
+    )
+
+
+def to_validation_error(error: _ErrorTuple) -> ValidationError:
+    field, error_type, value, ctx = error
+    message, expected = _MESSAGE_RENDERERS[error_type](field, value, ctx)
+
+    if error_type == "REQUIRED_FIELD_MISSING":
+        display_value = None
+    elif error_type in _ARRAY_ERROR_TYPES:
+        display_value = f"[{len(value)} items]"
+    else:
+        display_value = str(value)[:100]
+
+    return _mk_err(field, error_type, message, display_value, expected)
 
 
 class SchemaValidator:
     def __init__(self, contract_schema: ContractSchema):
         self.schema = contract_schema.schema
         self.logger = logging.getLogger(__name__)
-        self.compiled_patterns = {}
-        self._compile_patterns()
-
-    def _compile_patterns(self):
+        self.field_patterns: Dict[str, Pattern[str]] = {}
+        # Unhashable enum values fall back to the contract's list.
+        self.field_enums: Dict[str, Union[FrozenSet[Any], List[Any]]] = {}
+        self._ts_min: Dict[str, datetime] = {}
+        self._ts_max: Dict[str, datetime] = {}
+        self._compile_schema()
+        self._plan = self._build_plan()
+
+    def _compile_schema(self):
         for field_name, field_def in self.schema.items():
             if field_def.pattern:
                 try:
-                    self.compiled_patterns[field_name] = re.compile(field_def.pattern)
+                    self.field_patterns[field_name] = compile_pattern(field_def.pattern)
                 except re.error as e:
                     self.logger.error(f"Invalid regex pattern for {field_name}: {e}")
 
+            if field_def.enum:
+                try:
+                    self.field_enums[field_name] = frozenset(field_def.enum)
+                except TypeError:
+                    self.field_enums[field_name] = field_def.enum
+
+            if field_def.type == "timestamp":
+                self._compile_ts_bound(self._ts_min, field_name, field_def.min)
+                self._compile_ts_bound(self._ts_max, field_name, field_def.max)
+
+    def _compile_ts_bound(
+        self, bounds: Dict[str, datetime], field_name: str, bound: Any
+    ) -> None:
+        if not bound:
+            return
+
+        try:
+            bounds[field_name] = datetime.fromisoformat(str(bound))
+        except ValueError as e:
+            self.logger.error(f"Invalid timestamp bound for {field_name}: {e}")
+
+    # Resolves the type check and value validator for each field once, so
+    # validate_raw does no per-record dispatch on type names.
+    def _build_plan(self) -> List[Tuple[str, FieldDefinition, Any, Any]]:
+        value_validators = {
+            "string": self._validate_string,
+            "integer": self._validate_number,
+            "float": self._validate_number,
+            "timestamp": self._validate_timestamp,
+            "array": self._validate_array,
+            "object": self._validate_object,
+        }
+
+        return [
+            (
+                field_name,
+                field_def,
+                _TYPE_CHECKS.get(field_def.type),
+                value_validators.get(field_def.type),
+            )
+            for field_name, field_def in self.schema.items()
+        ]
+
     def validate(self, data: Dict[str, Any]) -> List[ValidationError]:
-        errors = []
+        return [to_validation_error(e) for e in self.validate_raw(data)]
 
-        for field_name, field_def in self.schema.items():
-            if field_def.required and field_name not in data:
-                errors.append(
-                    ValidationError(
-                        field=field_name,
-                        error_type="REQUIRED_FIELD_MISSING",
-                        message=f"Required field '{field_name}' is missing",
-                        value=None,
-                        expected="required field",
-                    )
-                )
-                continue
+    def validate_raw(self, data: Dict[str, Any]) -> List[_ErrorTuple]:
+        errors: List[_ErrorTuple] = []
+        err_n = 0
 
-            if field_name not in data:
-                continue
+        for field_name, field_def, type_check, validate_value in self._plan:
+            value = data.get(field_name, _MISSING)
 
-            value = data[field_name]
+            if value is _MISSING:
+                if field_def.required:
+                    errors.append((field_name, "REQUIRED_FIELD_MISSING", None, None))
+                    err_n += 1
+                continue
 
             if value is None and not field_def.required:
                 continue
 
-            type_error = self._validate_type(field_name, value, field_def.type)
-            if type_error:
-                errors.append(type_error)
+            if type_check is None or not type_check(value):
+                errors.append((field_name, "TYPE_MISMATCH", value, field_def.type))
+                err_n += 1
                 continue
 
-            if field_def.type == "string":
-                errors.extend(self._validate_string(field_name, value, field_def))
-            elif field_def.type in ["integer", "float"]:
-                errors.extend(self._validate_number(field_name, value, field_def))
-            elif field_def.type == "timestamp":
-                errors.extend(self._validate_timestamp(field_name, value, field_def))
-            elif field_def.type == "array":
-                errors.extend(self._validate_array(field_name, value, field_def))
-            elif field_def.type == "object":
-                errors.extend(self._validate_object(field_name, value, field_def))
-
-            if len(errors) >= 10:
+            if validate_value is not None:
+                sub = validate_value(field_name, value, field_def)
+                if sub:
+                    errors.extend(sub)
+                    err_n += len(sub)
+
+            if err_n >= 10:
                 break
 
         return errors
 
     def _validate_type(
         self, field_name: str, value: Any, expected_type: str
-    ) -> Optional[ValidationError]:
-        type_checks = {
-            "string": lambda v: isinstance(v, str),
-            "integer": lambda v: isinstance(v, int) and not isinstance(v, bool),
-            "float": lambda v: isinstance(v, (int, float)) and not isinstance(v, bool),
-            "boolean": lambda v: isinstance(v, bool),
-            "timestamp": lambda v: isinstance(v, (str, int, float, datetime)),
-            "date": lambda v: isinstance(v, str),
-            "array": lambda v: isinstance(v, list),
-            "object": lambda v: isinstance(v, dict),
-        }
-
-        check = type_checks.get(expected_type)
+    ) -> Optional[_ErrorTuple]:
+        check = _TYPE_CHECKS.get(expected_type)
         if not check or not check(value):
-            return ValidationError(
-                field=field_name,
-                error_type="TYPE_MISMATCH",
-                message=f"Expected {expected_type}, got {type(value).__name__}",
-                value=str(value)[:100],
-                expected=expected_type,
-            )
+            return (field_name, "TYPE_MISMATCH", value, expected_type)
         return None
 
     def _validate_string(
         self, field_name: str, value: str, field_def: FieldDefinition
-    ) -> List[ValidationError]:
-        errors = []
-
-        if field_def.pattern and field_name in self.compiled_patterns:
-            if not self.compiled_patterns[field_name].match(value):
-                errors.append(
-                    ValidationError(
-                        field=field_name,
-                        error_type="PATTERN_MISMATCH",
-                        message=f"Value does not match pattern: {field_def.pattern}",
-                        value=value[:100],
-                        expected=field_def.pattern,
-                    )
-                )
+    ) -> List[_ErrorTuple]:
+        errors: List[_ErrorTuple] = []
+        pattern = self.field_patterns.get(field_name)
+        enum = self.field_enums.get(field_name, field_def.enum)
+
+        if pattern is not None and not pattern.match(value):
+            errors.append((field_name, "PATTERN_MISMATCH", value, field_def))
 
         if field_def.format:
-            if not self._validate_format(value, field_def.format):
-                errors.append(
-                    ValidationError(
-                        field=field_name,
-                        error_type="FORMAT_MISMATCH",
-                        message=f"Value does not match format: {field_def.format}",
-                        value=value[:100],
-                        expected=field_def.format,
-                    )
-                )
+            format_pattern = _FORMAT_PATTERNS.get(field_def.format)
+            if format_pattern is not None and not format_pattern.match(value):
+                errors.append((field_name, "FORMAT_MISMATCH", value, field_def))
 
         if field_def.min_length is not None and len(value) < field_def.min_length:
-            errors.append(
-                ValidationError(
-                    field=field_name,
-                    error_type="LENGTH_TOO_SHORT",
-                    message=f"Length {len(value)} is less than minimum {field_def.min_length}",
-                    value=value[:100],
-                    expected=f"min_length: {field_def.min_length}",
-                )
-            )
+            errors.append((field_name, "LENGTH_TOO_SHORT", value, field_def))
 
         if field_def.max_length is not None and len(value) > field_def.max_length:
-            errors.append(
-                ValidationError(
-                    field=field_name,
-                    error_type="LENGTH_TOO_LONG",
-                    message=f"Length {len(value)} exceeds maximum {field_def.max_length}",
-                    value=value[:100],
-                    expected=f"max_length: {field_def.max_length}",
-                )
-            )
+            errors.append((field_name, "LENGTH_TOO_LONG", value, field_def))
 
-        if field_def.enum and value not in field_def.enum:
-            errors.append(
-                ValidationError(
-                    field=field_name,
-                    error_type="ENUM_MISMATCH",
-                    message=f"Value not in allowed list: {field_def.enum}",
-                    value=value[:100],
-                    expected=str(field_def.enum),
-                )
-            )
+        if enum and value not in enum:
+            errors.append((field_name, "ENUM_MISMATCH", value, field_def))
 
         return errors
 
     def _validate_number(
         self, field_name: str, value: Union[int, float], field_def: FieldDefinition
-    ) -> List[ValidationError]:
-        errors = []
+    ) -> List[_ErrorTuple]:
+        errors: List[_ErrorTuple] = []
+        enum = self.field_enums.get(field_name, field_def.enum)
 
         if field_def.min is not None and value < field_def.min:
-            errors.append(
-                ValidationError(
-                    field=field_name,
-                    error_type="VALUE_TOO_SMALL",
-                    message=f"Value {value} is less than minimum {field_def.min}",
-                    value=str(value),
-                    expected=f"min: {field_def.min}",
-                )
-            )
+            errors.append((field_name, "VALUE_TOO_SMALL", value, field_def))
 
         if field_def.max is not None and value > field_def.max:
-            errors.append(
-                ValidationError(
-                    field=field_name,
-                    error_type="VALUE_TOO_LARGE",
-                    message=f"Value {value} exceeds maximum {field_def.max}",
-                    value=str(value),
-                    expected=f"max: {field_def.max}",
-                )
-            )
+            errors.append((field_name, "VALUE_TOO_LARGE", value, field_def))
 
-        if field_def.enum and value not in field_def.enum:
-            errors.append(
-                ValidationError(
-                    field=field_name,
-                    error_type="ENUM_MISMATCH",
-                    message=f"Value not in allowed list: {field_def.enum}",
-                    value=str(value),
-                    expected=str(field_def.enum),
-                )
-            )
+        if enum and value not in enum:
+            errors.append((field_name, "ENUM_MISMATCH", value, field_def))
 
         return errors
 
     def _validate_timestamp(
         self, field_name: str, value: Any, field_def: FieldDefinition
-    ) -> List[ValidationError]:
-        errors = []
+    ) -> List[_ErrorTuple]:
+        if isinstance(value, datetime):
+            dt = value
+        else:
+            try:
+                if isinstance(value, str):
+                    dt = datetime.fromisoformat(value)
+                elif isinstance(value, (int, float)):
+                    dt = datetime.fromtimestamp(value)
+                else:
+                    return [(field_name, "INVALID_TIMESTAMP", value, None)]
+            except (ValueError, OverflowError, OSError) as e:
+                return [(field_name, "INVALID_TIMESTAMP", value, e)]
+
+        errors: List[_ErrorTuple] = []
+        min_dt = self._ts_min.get(field_name)
+        max_dt = self._ts_max.get(field_name)
 
         try:
-            if isinstance(value, str):
-                dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
-            elif isinstance(value, (int, float)):
-                dt = datetime.fromtimestamp(value)
-            elif isinstance(value, datetime):
-                dt = value
-            else:
-                errors.append(
-                    ValidationError(
-                        field=field_name,
-                        error_type="INVALID_TIMESTAMP",
-                        message="Cannot parse timestamp",
-                        value=str(value)[:100],
-                        expected="ISO 8601 or Unix timestamp",
-                    )
-                )
-                return errors
+            if min_dt is not None and dt < min_dt:
+                errors.append((field_name, "TIMESTAMP_TOO_OLD", value, field_def))
 
-            if field_def.min:
-                min_dt = datetime.fromisoformat(
-                    str(field_def.min).replace("Z", "+00:00")
-                )
-                if dt < min_dt:
-                    errors.append(
-                        ValidationError(
-                            field=field_name,
-                            error_type="TIMESTAMP_TOO_OLD",
-                            message=f"Timestamp before minimum: {field_def.min}",
-                            value=str(value)[:100],
-                            expected=f"min: {field_def.min}",
-                        )
-                    )
-
-            if field_def.max:
-                max_dt = datetime.fromisoformat(
-                    str(field_def.max).replace("Z", "+00:00")
-                )
-                if dt > max_dt:
-                    errors.append(
-                        ValidationError(
-                            field=field_name,
-                            error_type="TIMESTAMP_TOO_RECENT",
-                            message=f"Timestamp after maximum: {field_def.max}",
-                            value=str(value)[:100],
-                            expected=f"max: {field_def.max}",
-                        )
-                    )
-
-        except Exception as e:
-            errors.append(
-                ValidationError(
-                    field=field_name,
-                    error_type="INVALID_TIMESTAMP",
-                    message=f"Cannot parse timestamp: {str(e)}",
-                    value=str(value)[:100],
-                    expected="Valid timestamp",
-                )
-            )
+            if max_dt is not None and dt > max_dt:
+                errors.append((field_name, "TIMESTAMP_TOO_RECENT", value, field_def))
+        except TypeError as e:
+            errors.append((field_name, "INVALID_TIMESTAMP", value, e))
 
         return errors
 
     def _validate_array(
         self, field_name: str, value: List, field_def: FieldDefinition
-    ) -> List[ValidationError]:
-        errors = []
-
-        if field_def.min is not None and len(value) < field_def.min:
-            errors.append(
-                ValidationError(
-                    field=field_name,
-                    error_type="ARRAY_TOO_SHORT",
-                    message=f"Array length {len(value)} less than minimum {field_def.min}",
-                    value=f"[{len(value)} items]",
-                    expected=f"min: {field_def.min}",
-                )
-            )
+    ) -> List[_ErrorTuple]:
+        errors: List[_ErrorTuple] = []
+        length = len(value)
 
-        if field_def.max is not None and len(value) > field_def.max:
-            errors.append(
-                ValidationError(
-                    field=field_name,
-                    error_type="ARRAY_TOO_LONG",
-                    message=f"Array length {len(value)} exceeds maximum {field_def.max}",
-                    value=f"[{len(value)} items]",
-                    expected=f"max: {field_def.max}",
-                )
-            )
+        if field_def.min is not None and length < field_def.min:
+            errors.append((field_name, "ARRAY_TOO_SHORT", value, field_def))
+
+        if field_def.max is not None and length > field_def.max:
+            errors.append((field_name, "ARRAY_TOO_LONG", value, field_def))
 
         if field_def.items:
+            err_n = len(errors)
             for idx, item in enumerate(value[:10]):
                 item_errors = self._validate_nested_field(
                     f"{field_name}[{idx}]", item, field_def.items
                 )
-                errors.extend(item_errors)
-                if len(errors) >= 10:
-                    break
+                if item_errors:
+                    errors.extend(item_errors)
+                    err_n += len(item_errors)
+                    if err_n >= 10:
+                        break
 
         return errors
 
     def _validate_object(
         self, field_name: str, value: Dict, field_def: FieldDefinition
-    ) -> List[ValidationError]:
-        errors = []
+    ) -> List[_ErrorTuple]:
+        errors: List[_ErrorTuple] = []
+        err_n = 0
 
         if field_def.properties:
             for prop_name, prop_def in field_def.properties.items():
                 prop_path = f"{field_name}.{prop_name}"
 
-                if prop_def.required and prop_name not in value:
-                    errors.append(
-                        ValidationError(
-                            field=prop_path,
-                            error_type="REQUIRED_FIELD_MISSING",
-                            message=f"Required property '{prop_name}' is missing",
-                            value=None,
-                            expected="required property",
-                        )
-                    )
-                    continue
+                prop_value = value.get(prop_name, _MISSING)
 
-                if prop_name in value:
+                if prop_value is _MISSING:
+                    if prop_def.required:
+                        errors.append(
+                            (prop_path, "REQUIRED_FIELD_MISSING", None, prop_name)
+                        )
+                        err_n += 1
+                        continue
+                else:
                     prop_errors = self._validate_nested_field(
-                        prop_path, value[prop_name], prop_def
+                        prop_path, prop_value, prop_def
                     )
-                    errors.extend(prop_errors)
+                    if prop_errors:
+                        errors.extend(prop_errors)
+                        err_n += len(prop_errors)
 
-                if len(errors) >= 10:
+                if err_n >= 10:
                     break
 
         return errors
 
     def _validate_nested_field(
         self, field_path: str, value: Any, field_def: FieldDefinition
-    ) -> List[ValidationError]:
-        errors = []
+    ) -> List[_ErrorTuple]:
+        errors: List[_ErrorTuple] = []
 
         type_error = self._validate_type(field_path, value, field_def.type)
         if type_error:
@@ -351,18 +384,3 @@ class SchemaValidator:
             errors.extend(self._validate_object(field_path, value, field_def))
 
         return errors
-
-    @lru_cache(maxsize=100)
-    def _validate_format(self, value: str, format_type: str) -> bool:
-        format_patterns = {
-            "email": r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$",
-            "url": r"^https?://[^\s/$.?#].[^\s]*$",
-            "uuid": r"^[0-9a-f]{8}-([0-9a-f]{4}-){3}[0-9a-f]{12}$",
-            "ipv4": r"^((25[0-5]|2[0-4][0-9]|1[0-9][0-9]|[1-9]?[0-9])\.){3}(25[0-5]|2[0-4][0-9]|1[0-9][0-9]|[1-9]?[0-9])$",
-        }
-
-        pattern = format_patterns.get(format_type)
-        if not pattern:
-            return True
-
-        return bool(re.match(pattern, value, re.IGNORECASE))
@@ -1,17 +1,19 @@
 import time
 import logging
+from collections import Counter
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 from uuid import UUID
-import uuid
 
 from sqlalchemy.orm import Session
 
 from app.core.contract_manager import ContractManager
-from app.core.schema_validator import SchemaValidator
+from app.core.schema_validator import SchemaValidator, _ErrorTuple, to_validation_error
 from app.core.quality_validator import QualityValidator
 from app.models.schemas import ValidationResult, ValidationError, BatchValidationResult
-from app.models.database import ValidationResult as DBValidationResult
+from app.models.database import ValidationResult as DBValidationResult, uuid7
+
+MAX_SAMPLE_ERRORS = 50
 
 
 class ValidationEngine:
@@ -25,11 +27,10 @@ class ValidationEngine:
     ) -> ValidationResult:
         start_time = time.time()
 
-        contract = self.contract_manager.get_contract_by_id(contract_id)
-        if not contract:
+        found = self.contract_manager.get_contract_with_schema(contract_id)
+        if found is None:
             raise ValueError(f"Contract {contract_id} not found")
-
-        contract_schema = self.contract_manager.get_contract_schema(contract_id)
+        contract, contract_schema = found
 
         schema_validator = SchemaValidator(contract_schema)
         schema_errors = schema_validator.validate(data)
@@ -77,30 +78,39 @@ class ValidationEngine:
         batch_id: Optional[UUID] = None,
     ) -> BatchValidationResult:
         if batch_id is None:
-            batch_id = uuid.uuid4()
+            batch_id = uuid7()
 
         start_time = time.time()
 
-        contract = self.contract_manager.get_contract_by_id(contract_id)
-        if not contract:
+        found = self.contract_manager.get_contract_with_schema(contract_id)
+        if found is None:
             raise ValueError(f"Contract {contract_id} not found")
+        contract, contract_schema = found
 
-        contract_schema = self.contract_manager.get_contract_schema(contract_id)
         schema_validator = SchemaValidator(contract_schema)
 
         total_records = len(data)
         passed = 0
         failed = 0
-        all_errors = []
+        error_counts: Counter[str] = Counter()
+        raw_samples: List[_ErrorTuple] = []
 
         for record in data:
-            errors = schema_validator.validate(record)
+            errors = schema_validator.validate_raw(record)
 
             if len(errors) == 0:
                 passed += 1
-            else:
-                failed += 1
-                all_errors.extend(errors[:5])
+                continue
+
+            failed += 1
+            kept = errors[:5]
+            error_counts.update(error[1] for error in kept)
+
+            room = MAX_SAMPLE_ERRORS - len(raw_samples)
+            if room > 0:
+                raw_samples.extend(kept[:room])
+
+        sample_errors = [to_validation_error(e) for e in raw_samples]
 
         if passed > 0 and contract_schema.quality_rules:
             quality_validator = QualityValidator(contract_schema.quality_rules)
@@ -108,7 +118,8 @@ class ValidationEngine:
 
             if not quality_result.passed:
                 for qe in quality_result.errors:
-                    all_errors.append(
+                    error_counts[qe.rule_type] += 1
+                    sample_errors.append(
                         ValidationError(
                             field="batch_quality",
                             error_type=qe.rule_type,
@@ -121,10 +132,6 @@ class ValidationEngine:
         execution_time_ms = (time.time() - start_time) * 1000
         pass_rate = (passed / total_records * 100) if total_records > 0 else 0
 
-        error_counts = {}
-        for error in all_errors:
-            error_counts[error.error_type] = error_counts.get(error.error_type, 0) + 1
-
         result = BatchValidationResult(
             batch_id=str(batch_id),
             total_records=total_records,
@@ -132,8 +139,8 @@ class ValidationEngine:
             failed=failed,
             pass_rate=pass_rate,
             execution_time_ms=execution_time_ms,
-            errors_summary=error_counts,
-            sample_errors=all_errors[:50],
+            errors_summary=dict(error_counts),
+            sample_errors=sample_errors[:MAX_SAMPLE_ERRORS],
         )
 
         return result
@@ -148,7 +155,7 @@ class ValidationEngine:
             contract_id=str(contract_id),
             status=validation_result.status,
             errors=(
-                [e.dict() for e in validation_result.errors]
+                [dict(e.__dict__) for e in validation_result.errors]
                 if validation_result.errors
                 else None
             ),
@@ -1,5 +1,6 @@
 import logging
-from typing import Optional, List
+from functools import lru_cache
+from typing import Optional, List, Tuple
 from datetime import datetime, timezone
 from sqlalchemy.orm import Session
 
@@ -73,10 +74,7 @@ class VersionController:
     def calculate_next_version(
         self, current_version: str, change_report: ChangeReport
     ) -> str:
-        parts = current_version.split(".")
-        major = int(parts[0])
-        minor = int(parts[1])
-        patch = int(parts[2]) if len(parts) > 2 else 0
+        major, minor, patch = self._parse_semver(current_version)
 
         if change_report.has_breaking_changes:
             major += 1
@@ -90,6 +88,15 @@ class VersionController:
 
         return f"{major}.{minor}.{patch}"
 
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _parse_semver(version: str) -> Tuple[int, int, int]:
+        parts = version.split(".")
+        major = int(parts[0])
+        minor = int(parts[1]) if len(parts) > 1 else 0
+        patch = int(parts[2]) if len(parts) > 2 else 0
+        return major, minor, patch
+
     def get_version_history(
         self, contract_id: str, limit: int = 50
     ) -> List[ContractVersion]:
@@ -170,8 +177,7 @@ class VersionController:
             )
 
         current_version = contract.version
-        parts = current_version.split(".")
-        major = int(parts[0])
+        major = self._parse_semver(current_version)[0]
         new_version = f"{major + 1}.0.0"
 
         rollback_version = ContractVersion(
@@ -1,13 +1,74 @@
-import yaml
 import re
+import hashlib
 import logging
-from typing import Dict, Any
-from app.models.schemas import ContractSchema, FieldDefinition
+import orjson
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple
+from app.models.schemas import FIELD_MAP_ADAPTER, ContractSchema, FieldDefinition
+from app.utils.cache import TrackedLRUCache, compile_pattern
 
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=None)
+def _yaml() -> Tuple[Any, Any, Any]:
+    # PyYAML is imported on first use, not at app import. Returns the module
+    # plus the libyaml-backed safe loader/dumper when available.
+    import yaml
+
+    return (
+        yaml,
+        getattr(yaml, "CSafeLoader", yaml.SafeLoader),
+        getattr(yaml, "CSafeDumper", yaml.SafeDumper),
+    )
+
+
+# Ordered tuples keep the error messages stable; frozensets back the lookups.
+_TYPE_NAMES = (
+    "string",
+    "integer",
+    "float",
+    "boolean",
+    "timestamp",
+    "date",
+    "array",
+    "object",
+)
+_ALLOWED_TYPES = frozenset(_TYPE_NAMES)
+_ALLOWED_TYPES_STR = ", ".join(_TYPE_NAMES)
+
+_FORMAT_NAMES = ("email", "url", "uuid", "ipv4")
+_ALLOWED_FORMATS = frozenset(_FORMAT_NAMES)
+_ALLOWED_FORMATS_STR = ", ".join(_FORMAT_NAMES)
+
+ALLOWED_FIELD_KEYS = frozenset(
+    {
+        "type",
+        "required",
+        "pattern",
+        "format",
+        "min",
+        "max",
+        "min_length",
+        "max_length",
+        "description",
+        "enum",
+    }
+)
+
+_REQUIRED_KEYS = ("contract_version", "schema")
+_REQUIRED_KEYS_STR = ", ".join(_REQUIRED_KEYS)
+
+MAX_CACHED_YAML_BYTES = 1024 * 1024
+
+# (name, spec, parent dict, key in parent, built children or None if unvisited)
+_SpecFrame = Tuple[str, Dict[str, Any], Dict[str, Any], str, Optional[Dict[str, Any]]]
+
+parse_cache = TrackedLRUCache(maxsize=2048)
+serialize_cache = TrackedLRUCache(maxsize=512)
+
+
 class YAMLParserError(Exception):
     pass
 
@@ -24,29 +85,135 @@ class InvalidSchemaError(YAMLParserError):
     pass
 
 
+def _validate_freshness(freshness: Any) -> Dict[str, Any]:
+    if not isinstance(freshness, dict):
+        raise InvalidSchemaError("Freshness rule must be a dictionary")
+
+    if "max_latency_hours" not in freshness:
+        raise InvalidSchemaError("Freshness rule must specify 'max_latency_hours'")
+
+    max_hours = freshness["max_latency_hours"]
+    if not isinstance(max_hours, (int, float)) or max_hours <= 0:
+        raise InvalidSchemaError("max_latency_hours must be a positive number")
+
+    return freshness
+
+
+def _validate_completeness(completeness: Any) -> Dict[str, Any]:
+    if not isinstance(completeness, dict):
+        raise InvalidSchemaError("Completeness rule must be a dictionary")
+
+    if "min_row_count" in completeness:
+        min_rows = completeness["min_row_count"]
+        if not isinstance(min_rows, int) or min_rows < 0:
+            raise InvalidSchemaError("min_row_count must be a non-negative integer")
+
+    if "max_null_percentage" in completeness:
+        max_null = completeness["max_null_percentage"]
+        if not isinstance(max_null, (int, float)) or not (0 <= max_null <= 100):
+            raise InvalidSchemaError("max_null_percentage must be between 0 and 100")
+
+    return completeness
+
+
+def _validate_uniqueness(uniqueness: Any) -> Dict[str, Any]:
+    if not isinstance(uniqueness, dict):
+        raise InvalidSchemaError("Uniqueness rule must be a dictionary")
+
+    if "fields" not in uniqueness:
+        raise InvalidSchemaError("Uniqueness rule must specify 'fields'")
+
+    fields = uniqueness["fields"]
+    if not isinstance(fields, list) or not fields:
+        raise InvalidSchemaError("Uniqueness fields must be a non-empty list")
+
+    return uniqueness
+
+
+def _validate_statistics(statistics: Any) -> Dict[str, Any]:
+    if not isinstance(statistics, dict):
+        raise InvalidSchemaError("Statistics rule must be a dictionary")
+
+    for field_name, constraints in statistics.items():
+        if not isinstance(constraints, dict):
+            raise InvalidSchemaError(
+                f"Statistics for field '{field_name}' must be a dictionary"
+            )
+
+    return statistics
+
+
+# Checked in this order; rule names not listed here are dropped.
+_RULE_VALIDATORS = {
+    "freshness": _validate_freshness,
+    "completeness": _validate_completeness,
+    "uniqueness": _validate_uniqueness,
+    "statistics": _validate_statistics,
+}
+
+
+# Optional FieldDefinition keys omitted from exported YAML when None / falsy.
+_NOT_NONE_FIELD_KEYS = ("min", "max", "min_length", "max_length")
+_TRUTHY_FIELD_KEYS = ("pattern", "format", "description", "enum", "items", "properties")
+
+
+def _prune_field_dict(field: Dict[str, Any]) -> Dict[str, Any]:
+    for key in _NOT_NONE_FIELD_KEYS:
+        if field[key] is None:
+            del field[key]
+
+    for key in _TRUTHY_FIELD_KEYS:
+        if not field[key]:
+            del field[key]
+
+    if "items" in field:
+        _prune_field_dict(field["items"])
+
+    if "properties" in field:
+        for prop in field["properties"].values():
+            _prune_field_dict(prop)
+
+    return field
+
+
 class YAMLParser:
     def __init__(self):
         self.logger = logging.getLogger(__name__)
 
     def parse_yaml(self, yaml_content: str) -> ContractSchema:
+        encoded = yaml_content.encode()
+        if len(encoded) > MAX_CACHED_YAML_BYTES:
+            return self._parse_yaml_uncached(yaml_content)
+
+        key = hashlib.blake2b(encoded, digest_size=16).digest()
+        contract_schema = parse_cache.get(key)
+        if contract_schema is None:
+            contract_schema = self._parse_yaml_uncached(yaml_content)
+            parse_cache.put(key, contract_schema)
+
+        return contract_schema.model_copy(deep=True)
+
+    def _parse_yaml_uncached(self, yaml_content: str) -> ContractSchema:
+        yaml, loader, _ = _yaml()
         try:
-            data = yaml.safe_load(yaml_content)
+            data = yaml.load(yaml_content, Loader=loader)
         except yaml.YAMLError as e:
             raise YAMLSyntaxError(f"Invalid YAML syntax: {str(e)}")
 
         if not isinstance(data, dict):
             raise YAMLSyntaxError("YAML must be a dictionary/object")
 
-        required_keys = ["contract_version", "schema"]
-        for key in required_keys:
+        for key in _REQUIRED_KEYS:
             if key not in data:
                 raise MissingRequiredKeyError(
                     f"Missing required key: '{key}'. "
-                    f"Contract must include: {', '.join(required_keys)}"
+                    f"Contract must include: {_REQUIRED_KEYS_STR}"
                 )
 
         try:
-            schema_fields = self._parse_schema(data["schema"])
+            schema_fields = FIELD_MAP_ADAPTER.validate_python(
+                self._parse_schema(data["schema"])
+            )
         except Exception as e:
             raise InvalidSchemaError(f"Invalid schema definition: {str(e)}")
 
@@ -74,59 +241,91 @@ class YAMLParser:
         )
         return contract_schema
 
-    def _parse_schema(self, schema_dict: Dict[str, Any]) -> Dict[str, FieldDefinition]:
+    def _parse_schema(self, schema_dict: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
         if not isinstance(schema_dict, dict):
             raise InvalidSchemaError("Schema must be a dictionary")
 
         if not schema_dict:
             raise InvalidSchemaError("Schema must contain at least one field")
 
-        parsed_fields = {}
-
-        for field_name, field_spec in schema_dict.items():
-            if not isinstance(field_spec, dict):
-                raise InvalidSchemaError(
-                    f"Field '{field_name}' specification must be a dictionary"
-                )
+        return {
+            field_name: self._parse_field(field_name, field_spec)
+            for field_name, field_spec in schema_dict.items()
+        }
 
-            try:
-                field_def = self.validate_field_definition(field_name, field_spec)
-                parsed_fields[field_name] = field_def
-            except Exception as e:
-                raise InvalidSchemaError(
-                    f"Invalid field definition for '{field_name}': {str(e)}"
-                )
+    def _parse_field(
+        self, field_name: str, field_spec: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        if not isinstance(field_spec, dict):
+            raise InvalidSchemaError(
+                f"Field '{field_name}' specification must be a dictionary"
+            )
 
-        return parsed_fields
+        try:
+            return self._clean_field_spec(field_name, field_spec)
+        except Exception as e:
+            raise InvalidSchemaError(
+                f"Invalid field definition for '{field_name}': {str(e)}"
+            )
 
     def validate_field_definition(
         self, field_name: str, field_def: Dict[str, Any]
     ) -> FieldDefinition:
+        return FieldDefinition.model_validate(
+            self._clean_field_spec(field_name, field_def)
+        )
+
+    def _clean_field_spec(
+        self, field_name: str, field_def: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        # Each spec is visited twice: checked on entry, built on exit once its
+        # children exist. Same order (and first error) as a recursive walk.
+        # The result is a plain dict holding only the keys FieldDefinition
+        # takes; pydantic turns the whole tree into models in one pass.
+        root: Dict[str, Any] = {}
+        stack: List[_SpecFrame] = [(field_name, field_def, root, field_name, None)]
+
+        while stack:
+            name, spec, target, key, children = stack.pop()
+
+            if children is not None:
+                target[key] = self._build_field_spec(spec, children)
+                continue
+
+            self._check_field_spec(name, spec)
+
+            children = {"items": None, "properties": None}
+            stack.append((name, spec, target, key, children))
+
+            if spec["type"] == "array":
+                stack.append((f"{name}[]", spec["items"], children, "items", None))
+            elif spec["type"] == "object":
+                properties: Dict[str, Any] = {}
+                children["properties"] = properties
+                pending = [
+                    (f"{name}.{prop_name}", prop_def, properties, prop_name, None)
+                    for prop_name, prop_def in spec["properties"].items()
+                ]
+                stack.extend(reversed(pending))
+
+        return root[field_name]
+
+    def _check_field_spec(self, field_name: str, field_def: Dict[str, Any]) -> None:
         if "type" not in field_def:
             raise InvalidSchemaError(f"Field '{field_name}' must specify 'type'")
 
         field_type = field_def["type"]
 
-        allowed_types = [
-            "string",
-            "integer",
-            "float",
-            "boolean",
-            "timestamp",
-            "date",
-            "array",
-            "object",
-        ]
-        if field_type not in allowed_types:
+        if not isinstance(field_type, str) or field_type not in _ALLOWED_TYPES:
             raise InvalidSchemaError(
                 f"Invalid type '{field_type}' for field '{field_name}'. "
-                f"Must be one of: {', '.join(allowed_types)}"
+                f"Must be one of: {_ALLOWED_TYPES_STR}"
             )
 
         pattern = field_def.get("pattern")
         if pattern:
             try:
-                re.compile(pattern)
+                compile_pattern(pattern)
             except re.error as e:
                 raise InvalidSchemaError(
                     f"Invalid regex pattern for field '{field_name}': {str(e)}"
@@ -134,11 +333,10 @@ class YAMLParser:
 
         format_type = field_def.get("format")
         if format_type:
-            allowed_formats = ["email", "url", "uuid", "ipv4"]
-            if format_type not in allowed_formats:
+            if not isinstance(format_type, str) or format_type not in _ALLOWED_FORMATS:
                 raise InvalidSchemaError(
                     f"Invalid format '{format_type}' for field '{field_name}'. "
-                    f"Must be one of: {', '.join(allowed_formats)}"
+                    f"Must be one of: {_ALLOWED_FORMATS_STR}"
                 )
 
         min_val = field_def.get("min")
@@ -157,137 +355,51 @@ class YAMLParser:
                     f"Field '{field_name}': min_length must be <= max_length"
                 )
 
-        items = None
-        if field_type == "array":
-            if "items" not in field_def:
-                raise InvalidSchemaError(
-                    f"Array field '{field_name}' must specify 'items'"
-                )
-            items = self.validate_field_definition(
-                f"{field_name}[]", field_def["items"]
-            )
+        if field_type == "array" and "items" not in field_def:
+            raise InvalidSchemaError(f"Array field '{field_name}' must specify 'items'")
 
-        properties = None
-        if field_type == "object":
-            if "properties" not in field_def:
-                raise InvalidSchemaError(
-                    f"Object field '{field_name}' must specify 'properties'"
-                )
-            properties = {}
-            for prop_name, prop_def in field_def["properties"].items():
-                properties[prop_name] = self.validate_field_definition(
-                    f"{field_name}.{prop_name}", prop_def
-                )
-
-        field_definition = FieldDefinition(
-            type=field_type,
-            required=field_def.get("required", True),
-            pattern=pattern,
-            format=format_type,
-            min=min_val,
-            max=max_val,
-            min_length=min_length,
-            max_length=max_length,
-            description=field_def.get("description"),
-            enum=field_def.get("enum"),
-            items=items,
-            properties=properties,
-        )
+        if field_type == "object" and "properties" not in field_def:
+            raise InvalidSchemaError(
+                f"Object field '{field_name}' must specify 'properties'"
+            )
 
-        return field_definition
+    def _build_field_spec(
+        self, field_def: Dict[str, Any], children: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        spec = {key: field_def[key] for key in ALLOWED_FIELD_KEYS & field_def.keys()}
+        spec["items"] = children["items"]
+        spec["properties"] = children["properties"]
+        return spec
 
     def validate_quality_rules(self, rules: Dict[str, Any]) -> Dict[str, Any]:
         if not isinstance(rules, dict):
             raise InvalidSchemaError("Quality rules must be a dictionary")
 
-        validated_rules = {}
-
-        if "freshness" in rules:
-            freshness = rules["freshness"]
-            if not isinstance(freshness, dict):
-                raise InvalidSchemaError("Freshness rule must be a dictionary")
-
-            if "max_latency_hours" not in freshness:
-                raise InvalidSchemaError(
-                    "Freshness rule must specify 'max_latency_hours'"
-                )
-
-            max_hours = freshness["max_latency_hours"]
-            if not isinstance(max_hours, (int, float)) or max_hours <= 0:
-                raise InvalidSchemaError("max_latency_hours must be a positive number")
-
-            validated_rules["freshness"] = freshness
-
-        if "completeness" in rules:
-            completeness = rules["completeness"]
-            if not isinstance(completeness, dict):
-                raise InvalidSchemaError("Completeness rule must be a dictionary")
-
-            if "min_row_count" in completeness:
-                min_rows = completeness["min_row_count"]
-                if not isinstance(min_rows, int) or min_rows < 0:
-                    raise InvalidSchemaError(
-                        "min_row_count must be a non-negative integer"
-                    )
-
-            if "max_null_percentage" in completeness:
-                max_null = completeness["max_null_percentage"]
-                if not isinstance(max_null, (int, float)) or not (0 <= max_null <= 100):
-                    raise InvalidSchemaError(
-                        "max_null_percentage must be between 0 and 100"
-                    )
-
-            validated_rules["completeness"] = completeness
-
-        if "uniqueness" in rules:
-            uniqueness = rules["uniqueness"]
-            if not isinstance(uniqueness, dict):
-                raise InvalidSchemaError("Uniqueness rule must be a dictionary")
-
-            if "fields" not in uniqueness:
-                raise InvalidSchemaError("Uniqueness rule must specify 'fields'")
-
-            fields = uniqueness["fields"]
-            if not isinstance(fields, list) or not fields:
-                raise InvalidSchemaError("Uniqueness fields must be a non-empty list")
-
-            validated_rules["uniqueness"] = uniqueness
-
-        if "statistics" in rules:
-            statistics = rules["statistics"]
-            if not isinstance(statistics, dict):
-                raise InvalidSchemaError("Statistics rule must be a dictionary")
-
-            for field_name, constraints in statistics.items():
-                if not isinstance(constraints, dict):
-                    raise InvalidSchemaError(
-                        f"Statistics for field '{field_name}' must be a dictionary"
-                    )
-
-            validated_rules["statistics"] = statistics
-
-        return validated_rules
-
-    def serialize_to_yaml(self, contract_schema: ContractSchema) -> str:
-        data = {
-            "contract_version": contract_schema.contract_version,
-            "domain": contract_schema.domain,
+        return {
+            name: validator(rules[name])
+            for name, validator in _RULE_VALIDATORS.items()
+            if name in rules
         }
 
-        if contract_schema.description:
-            data["description"] = contract_schema.description
-
-        schema_dict = {}
-        for field_name, field_def in contract_schema.schema.items():
-            schema_dict[field_name] = self._field_definition_to_dict(field_def)
-
-        data["schema"] = schema_dict
+    def serialize_to_yaml(self, contract_schema: ContractSchema) -> str:
+        dumped = contract_schema.model_dump()
+        # repr() keeps str/date and int/float distinct, unlike a JSON dump.
+        key = hashlib.blake2b(repr(dumped).encode(), digest_size=16).digest()
+        return serialize_cache.get_or_create(
+            key, lambda: self._serialize_to_yaml_uncached(dumped)
+        )
 
-        if contract_schema.quality_rules:
-            data["quality_rules"] = contract_schema.quality_rules
+    def serialize_to_json(self, contract_schema: ContractSchema) -> bytes:
+        return orjson.dumps(
+            self._export_dict(contract_schema.model_dump()),
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+        )
 
+    def _serialize_to_yaml_uncached(self, dumped: Dict[str, Any]) -> str:
+        yaml, _, dumper = _yaml()
         yaml_str = yaml.dump(
-            data,
+            self._export_dict(dumped),
+            Dumper=dumper,
             default_flow_style=False,
             sort_keys=False,
             indent=2,
@@ -296,40 +408,21 @@ class YAMLParser:
 
         return yaml_str
 
-    def _field_definition_to_dict(self, field_def: FieldDefinition) -> Dict[str, Any]:
-        result = {"type": field_def.type, "required": field_def.required}
-
-        if field_def.pattern:
-            result["pattern"] = field_def.pattern
-
-        if field_def.format:
-            result["format"] = field_def.format
-
-        if field_def.min is not None:
-            result["min"] = field_def.min
-
-        if field_def.max is not None:
-            result["max"] = field_def.max
-
-        if field_def.min_length is not None:
-            result["min_length"] = field_def.min_length
-
-        if field_def.max_length is not None:
-            result["max_length"] = field_def.max_length
-
-        if field_def.description:
-            result["description"] = field_def.description
+    def _export_dict(self, dumped: Dict[str, Any]) -> Dict[str, Any]:
+        data = {
+            "contract_version": dumped["contract_version"],
+            "domain": dumped["domain"],
+        }
 
-        if field_def.enum:
-            result["enum"] = field_def.enum
+        if dumped["description"]:
+            data["description"] = dumped["description"]
 
-        if field_def.items:
-            result["items"] = self._field_definition_to_dict(field_def.items)
+        data["schema"] = {
+            field_name: _prune_field_dict(field)
+            for field_name, field in dumped["schema"].items()
+        }
 
-        if field_def.properties:
-            properties = {}
-            for prop_name, prop_def in field_def.properties.items():
-                properties[prop_name] = self._field_definition_to_dict(prop_def)
-            result["properties"] = properties
+        if dumped["quality_rules"]:
+            data["quality_rules"] = dumped["quality_rules"]
 
-        return result
+        return data
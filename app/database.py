@@ -1,14 +1,21 @@
 import logging
-from typing import Generator
-from sqlalchemy import create_engine, event, text
+from typing import Any, Generator
+
+import orjson
+from sqlalchemy import create_engine, text
 from sqlalchemy.orm import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
-from sqlalchemy.pool import Pool
 
 from app.config import settings
+from app.core.partitions import ensure_partitions
 
 logger = logging.getLogger(__name__)
 
+
+def _json_serializer(value: Any) -> str:
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
 engine = create_engine(
     settings.DATABASE_URL,
     pool_pre_ping=True,
@@ -16,7 +23,13 @@ engine = create_engine(
     max_overflow=15,
     pool_timeout=30,
     pool_recycle=3600,
-    echo=settings.DEBUG,
+    pool_use_lifo=True,
+    query_cache_size=1200,
+    future=True,
+    echo=settings.SQL_ECHO,
+    echo_pool="debug" if settings.SQL_ECHO else False,
+    json_serializer=_json_serializer,
+    json_deserializer=orjson.loads,
 )
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
@@ -24,16 +37,6 @@ SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
 
-@event.listens_for(Pool, "connect")
-def receive_connect(dbapi_conn, connection_record):
-    logger.debug("Database connection established")
-
-
-@event.listens_for(Pool, "checkout")
-def receive_checkout(dbapi_conn, connection_record, connection_proxy):
-    logger.debug("Connection checked out from pool")
-
-
 def get_db() -> Generator[Session, None, None]:
     db = SessionLocal()
     try:
@@ -45,6 +48,7 @@ def get_db() -> Generator[Session, None, None]:
 def init_db() -> None:
     logger.info("Initializing database tables...")
     Base.metadata.create_all(bind=engine)
+    ensure_partitions(engine)
     logger.info("Database tables created successfully")
 
 
@@ -1,14 +1,22 @@
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
 from contextlib import asynccontextmanager
 from datetime import datetime, timezone
+from typing import Optional
+import time
 from app.api import versions, metrics
 import logging
-from app.config import settings
+from app.config import Settings, settings
 from app.database import test_connection, close_db, init_db
 from app.utils.logging import setup_logging
-from app.utils.exceptions import DCEBaseException, format_error_response
+from app.utils.middleware import ETagMiddleware
+from app.utils.exceptions import (
+    DCEBaseException,
+    current_error_timestamp,
+    format_error_response,
+)
+from app.utils.responses import ORJSONResponse
 from app.utils.scheduler import setup_scheduler
 from app.api import contracts, templates, validation
 
@@ -16,6 +24,27 @@ setup_logging()
 logger = logging.getLogger(__name__)
 
 
+HEALTH_CHECK_TTL_SECONDS = 5.0
+
+_db_checked_at: Optional[float] = None
+_db_connected = False
+
+
+def _check_database() -> bool:
+    global _db_checked_at, _db_connected
+
+    now = time.monotonic()
+    if _db_checked_at is None or now - _db_checked_at >= HEALTH_CHECK_TTL_SECONDS:
+        try:
+            _db_connected = test_connection()
+        except Exception as e:
+            logger.error(f"Health check database error: {e}")
+            _db_connected = False
+        _db_checked_at = now
+
+    return _db_connected
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     logger.info("Starting Data Contract Engine...")
@@ -30,6 +59,10 @@ async def lifespan(app: FastAPI):
         setup_scheduler()
         logger.info("Scheduler setup complete")
 
+        if app.openapi_url:
+            app.openapi()
+            logger.info("OpenAPI schema generated")
+
     except Exception as e:
         logger.error(f"Startup failed: {e}")
         raise
@@ -45,115 +78,105 @@ async def lifespan(app: FastAPI):
         logger.error(f"Shutdown error: {e}")
 
 
-app = FastAPI(
-    title=settings.PROJECT_NAME,
-    description="Data Contract Engine API for managing and validating data contracts",
-    version=settings.VERSION,
-    lifespan=lifespan,
-    docs_url="/docs",
-    redoc_url="/redoc",
-    openapi_url="/openapi.json",
-)
-
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=settings.CORS_ORIGINS,
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-    expose_headers=["*"],
-)
-
-
-@app.exception_handler(DCEBaseException)
-async def dce_exception_handler(request: Request, exc: DCEBaseException):
-    return JSONResponse(
-        status_code=exc.status_code,
-        content=format_error_response(exc, path=str(request.url)),
+def create_app(settings: Settings = settings) -> FastAPI:
+    docs_enabled = not settings.is_production
+
+    app = FastAPI(
+        title=settings.PROJECT_NAME,
+        description="Data Contract Engine API for managing and validating data contracts",
+        version=settings.VERSION,
+        lifespan=lifespan,
+        default_response_class=ORJSONResponse,
+        docs_url="/docs" if docs_enabled else None,
+        redoc_url="/redoc" if docs_enabled else None,
+        openapi_url="/openapi.json" if docs_enabled else None,
+        swagger_ui_oauth2_redirect_url=(
+            "/docs/oauth2-redirect" if docs_enabled else None
+        ),
     )
 
+    app.add_middleware(ETagMiddleware)
+    app.add_middleware(GZipMiddleware, minimum_size=1024)
 
-@app.exception_handler(Exception)
-async def generic_exception_handler(request: Request, exc: Exception):
-    logger.error(f"Unexpected error: {exc}", exc_info=True)
-    return JSONResponse(
-        status_code=500,
-        content={
-            "error": "InternalServerError",
-            "message": "An unexpected error occurred",
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-            "path": str(request.url),
-        },
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=settings.CORS_ORIGINS,
+        allow_credentials=True,
+        allow_methods=["GET", "POST", "PUT", "DELETE", "PATCH", "OPTIONS"],
+        allow_headers=["Content-Type", "Authorization", "X-Requested-With"],
+        max_age=86400,
     )
 
-
-app.include_router(contracts.router, prefix=settings.API_V1_PREFIX)
-app.include_router(templates.router, prefix=settings.API_V1_PREFIX)
-app.include_router(validation.router, prefix=settings.API_V1_PREFIX)
-app.include_router(versions.router, prefix=settings.API_V1_PREFIX)
-app.include_router(metrics.router, prefix=settings.API_V1_PREFIX)
-
-
-@app.get("/health")
-async def health_check():
-    try:
-        test_connection()
-        db_status = "connected"
-    except Exception as e:
-        logger.error(f"Health check database error: {e}")
-        db_status = "disconnected"
-
-    overall_status = "healthy" if db_status == "connected" else "unhealthy"
-
-    return {
-        "status": overall_status,
-        "database": db_status,
-        "timestamp": datetime.now(timezone.utc),
-        "version": settings.VERSION,
-        "service": settings.PROJECT_NAME,
-    }
-
-
-@app.get("/")
-async def root():
-    return {
-        "message": "Data Contract Engine API",
-        "version": settings.VERSION,
-        "description": "API for managing and validating data contracts",
-        "docs": "/docs",
-        "health": "/health",
-        "api_version": "v1",
-        "api_prefix": settings.API_V1_PREFIX,
-    }
-
-
-@app.get(f"{settings.API_V1_PREFIX}/")
-async def api_root():
-    return {
-        "message": "Data Contract Engine API v1",
-        "version": settings.VERSION,
-        "endpoints": {
-            "contracts": f"{settings.API_V1_PREFIX}/contracts",
-            "templates": f"{settings.API_V1_PREFIX}/contracts/templates",
-            "validation": f"{settings.API_V1_PREFIX}/validate",
-            "versions": f"{settings.API_V1_PREFIX}/contract-versions/{{id}}/versions",
-            "metrics": f"{settings.API_V1_PREFIX}/metrics",
-            "health": "/health",
+    @app.exception_handler(DCEBaseException)
+    async def dce_exception_handler(request: Request, exc: DCEBaseException):
+        return ORJSONResponse(
+            status_code=exc.status_code,
+            content=format_error_response(exc, path=str(request.url)),
+        )
+
+    @app.exception_handler(Exception)
+    async def generic_exception_handler(request: Request, exc: Exception):
+        logger.error(f"Unexpected error: {exc}", exc_info=True)
+        return ORJSONResponse(
+            status_code=500,
+            content={
+                "error": "InternalServerError",
+                "message": "An unexpected error occurred",
+                "timestamp": current_error_timestamp(),
+                "path": str(request.url),
+            },
+        )
+
+    app.include_router(contracts.router, prefix=settings.API_V1_PREFIX)
+    app.include_router(templates.router, prefix=settings.API_V1_PREFIX)
+    app.include_router(validation.router, prefix=settings.API_V1_PREFIX)
+    app.include_router(versions.router, prefix=settings.API_V1_PREFIX)
+    app.include_router(metrics.router, prefix=settings.API_V1_PREFIX)
+
+    @app.get("/health")
+    async def health_check():
+        db_status = "connected" if _check_database() else "disconnected"
+
+        overall_status = "healthy" if db_status == "connected" else "unhealthy"
+
+        return {
+            "status": overall_status,
+            "database": db_status,
+            "timestamp": datetime.now(timezone.utc),
+            "version": settings.VERSION,
+            "service": settings.PROJECT_NAME,
+        }
+
+    @app.get("/")
+    async def root():
+        return {
+            "message": "Data Contract Engine API",
+            "version": settings.VERSION,
+            "description": "API for managing and validating data contracts",
             "docs": "/docs",
-            "openapi": "/openapi.json",
-        },
-    }
-
-
-@app.on_event("startup")
-async def startup_event():
-    logger.warning(
-        "Using deprecated @app.on_event('startup') - use lifespan context manager instead"
-    )
-
-
-@app.on_event("shutdown")
-async def shutdown_event():
-    logger.warning(
-        "Using deprecated @app.on_event('shutdown') - use lifespan context manager instead"
-    )
+            "health": "/health",
+            "api_version": "v1",
+            "api_prefix": settings.API_V1_PREFIX,
+        }
+
+    @app.get(f"{settings.API_V1_PREFIX}/")
+    async def api_root():
+        return {
+            "message": "Data Contract Engine API v1",
+            "version": settings.VERSION,
+            "endpoints": {
+                "contracts": f"{settings.API_V1_PREFIX}/contracts",
+                "templates": f"{settings.API_V1_PREFIX}/contracts/templates",
+                "validation": f"{settings.API_V1_PREFIX}/validate",
+                "versions": f"{settings.API_V1_PREFIX}/contract-versions/{{id}}/versions",
+                "metrics": f"{settings.API_V1_PREFIX}/metrics",
+                "health": "/health",
+                "docs": "/docs",
+                "openapi": "/openapi.json",
+            },
+        }
+
+    return app
+
+
+app = create_app()
@@ -1,9 +1,12 @@
+import os
+import time
 import uuid
 from datetime import datetime
 
 from sqlalchemy import (
     Boolean,
     Column,
+    Computed,
     String,
     Integer,
     Float,
@@ -14,24 +17,89 @@ from sqlalchemy import (
     Date,
     JSON,
 )
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import relationship
+from sqlalchemy.sql.functions import FunctionElement
 
 from app.database import Base
 
+JSONDocument = JSON().with_variant(JSONB(), "postgresql")
+UUIDString = String(36).with_variant(UUID(as_uuid=False), "postgresql")
+
+
+def generate_id() -> str:
+    return str(uuid.uuid4())
+
+
+# UUIDv7: 48-bit Unix milliseconds, then random bits. Ids created later sort
+# later, so inserts append to the right edge of the primary key B-tree.
+def uuid7() -> uuid.UUID:
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10), "big")
+    value = value & ~(0xF << 76) | 0x7 << 76
+    value = value & ~(0x3 << 62) | 0x2 << 62
+    return uuid.UUID(int=value)
+
+
+def generate_ordered_id() -> str:
+    return str(uuid7())
+
+
+class utcnow(FunctionElement):
+    type = DateTime()
+    inherit_cache = True
+
+
+@compiles(utcnow)
+def _default_utcnow(element, compiler, **kw):
+    return "CURRENT_TIMESTAMP"
+
+
+@compiles(utcnow, "postgresql")
+def _pg_utcnow(element, compiler, **kw):
+    return "TIMEZONE('utc', CURRENT_TIMESTAMP)"
+
+
+# Integer value of a top-level key in a JSON column, for generated columns.
+class json_int_field(FunctionElement):
+    type = Integer()
+    inherit_cache = False
+
+    def __init__(self, column: str, key: str):
+        self.column = column
+        self.key = key
+        super().__init__()
+
+
+@compiles(json_int_field)
+def _default_json_int_field(element, compiler, **kw):
+    return f"CAST(json_extract({element.column}, '$.{element.key}') AS INTEGER)"
+
+
+@compiles(json_int_field, "postgresql")
+def _pg_json_int_field(element, compiler, **kw):
+    return f"(({element.column} ->> '{element.key}')::integer)"
+
 
 class Contract(Base):
     __tablename__ = "contracts"
 
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(UUIDString, primary_key=True, default=generate_id)
     name = Column(String(255), unique=True, nullable=False, index=True)
     version = Column(String(20), nullable=False)
     domain = Column(String(100), nullable=False, index=True)
     yaml_content = Column(Text, nullable=False)
     description = Column(Text, nullable=True)
     is_active = Column(Boolean, default=True, nullable=False, index=True)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at = Column(
+        DateTime, default=datetime.utcnow, server_default=utcnow(), nullable=False
+    )
     updated_at = Column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
+        DateTime,
+        default=datetime.utcnow,
+        onupdate=datetime.utcnow,
+        server_default=utcnow(),
+        nullable=False,
     )
 
     versions = relationship(
@@ -67,15 +135,20 @@ class Contract(Base):
 class ContractVersion(Base):
     __tablename__ = "contract_versions"
 
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(UUIDString, primary_key=True, default=generate_id)
     contract_id = Column(
-        String(36), ForeignKey("contracts.id"), nullable=False, index=True
+        UUIDString, ForeignKey("contracts.id"), nullable=False, index=True
     )
     version = Column(String(20), nullable=False)
     yaml_content = Column(Text, nullable=False)
     change_type = Column(String(20), nullable=True)
-    change_summary = Column(JSON, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    change_summary = Column(JSONDocument, nullable=True)
+    total_changes = Column(
+        Integer, Computed(json_int_field("change_summary", "total_changes"))
+    )
+    created_at = Column(
+        DateTime, default=datetime.utcnow, server_default=utcnow(), nullable=False
+    )
     created_by = Column(String(100), nullable=True)
 
     contract = relationship("Contract", back_populates="versions")
@@ -88,6 +161,7 @@ class ContractVersion(Base):
             unique=True,
         ),
         Index("ix_contract_versions_created_at", "created_at"),
+        Index("ix_contract_versions_total_changes", "total_changes"),
     )
 
     def __repr__(self) -> str:
@@ -109,38 +183,58 @@ class ContractVersion(Base):
 class ValidationResult(Base):
     __tablename__ = "validation_results"
 
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(UUIDString, primary_key=True, default=generate_ordered_id)
     contract_id = Column(
-        String(36), ForeignKey("contracts.id"), nullable=False, index=True
+        UUIDString, ForeignKey("contracts.id"), nullable=False, index=True
     )
     status = Column(String(20), nullable=False, index=True)
-    data_snapshot = Column(JSON, nullable=True)
-    errors = Column(JSON, nullable=True)
+    data_snapshot = Column(JSONDocument, nullable=True)
+    errors = Column(JSONDocument, nullable=True)
     execution_time_ms = Column(Float, nullable=False)
-    validated_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
-    batch_id = Column(String(36), nullable=True, index=True)
+    validated_at = Column(
+        DateTime,
+        primary_key=True,
+        default=datetime.utcnow,
+        server_default=utcnow(),
+        nullable=False,
+        index=True,
+    )
+    batch_id = Column(UUIDString, nullable=True, index=True)
 
     contract = relationship("Contract", back_populates="validation_results")
 
     __table_args__ = (
         Index("ix_validation_results_contract_date", "contract_id", "validated_at"),
+        Index(
+            "ix_validation_results_errors_gin",
+            "errors",
+            postgresql_using="gin",
+            postgresql_ops={"errors": "jsonb_path_ops"},
+        ),
+        {"postgresql_partition_by": "RANGE (validated_at)"},
     )
 
     def __repr__(self) -> str:
         return f"<ValidationResult(id={self.id}, status='{self.status}')>"
 
     def to_dict(self) -> dict:
+        return self.row_to_dict(self)
+
+    # Accepts an instance or a column Row from a select over the table, so
+    # list queries can skip ORM object construction.
+    @staticmethod
+    def row_to_dict(row) -> dict:
         return {
-            "id": str(self.id),
-            "contract_id": str(self.contract_id),
-            "status": self.status,
-            "data_snapshot": self.data_snapshot,
-            "errors": self.errors,
-            "execution_time_ms": self.execution_time_ms,
+            "id": str(row.id),
+            "contract_id": str(row.contract_id),
+            "status": row.status,
+            "data_snapshot": row.data_snapshot,
+            "errors": row.errors,
+            "execution_time_ms": row.execution_time_ms,
             "validated_at": (
-                self.validated_at.isoformat() if self.validated_at else None
+                row.validated_at.isoformat() if row.validated_at else None
             ),
-            "batch_id": str(self.batch_id) if self.batch_id else None,
+            "batch_id": str(row.batch_id) if row.batch_id else None,
         }
 
     def is_pass(self) -> bool:
@@ -153,9 +247,9 @@ class ValidationResult(Base):
 class QualityMetric(Base):
     __tablename__ = "quality_metrics"
 
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(UUIDString, primary_key=True, default=generate_id)
     contract_id = Column(
-        String(36), ForeignKey("contracts.id"), nullable=False, index=True
+        UUIDString, ForeignKey("contracts.id"), nullable=False, index=True
     )
     metric_date = Column(Date, nullable=False)
     total_validations = Column(Integer, default=0, nullable=False)
@@ -163,9 +257,11 @@ class QualityMetric(Base):
     failed = Column(Integer, default=0, nullable=False)
     pass_rate = Column(Float, nullable=True)
     avg_execution_time_ms = Column(Float, nullable=True)
-    top_errors = Column(JSON, nullable=True)
+    top_errors = Column(JSONDocument, nullable=True)
     quality_score = Column(Float, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at = Column(
+        DateTime, default=datetime.utcnow, server_default=utcnow(), nullable=False
+    )
 
     contract = relationship("Contract", back_populates="quality_metrics")
 
@@ -177,6 +273,12 @@ class QualityMetric(Base):
             unique=True,
         ),
         Index("ix_quality_metrics_date", "metric_date"),
+        Index(
+            "ix_quality_metrics_top_errors_gin",
+            "top_errors",
+            postgresql_using="gin",
+            postgresql_ops={"top_errors": "jsonb_path_ops"},
+        ),
     )
 
     def __repr__(self) -> str:
@@ -206,10 +308,10 @@ class QualityMetric(Base):
 class BatchSummary(Base):
     __tablename__ = "batch_summaries"
 
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
-    batch_id = Column(String(36), unique=True, nullable=False, index=True)
+    id = Column(UUIDString, primary_key=True, default=generate_id)
+    batch_id = Column(UUIDString, unique=True, nullable=False, index=True)
     contract_id = Column(
-        String(36), ForeignKey("contracts.id"), nullable=False, index=True
+        UUIDString, ForeignKey("contracts.id"), nullable=False, index=True
     )
     total_records = Column(Integer, nullable=False)
     passed = Column(Integer, nullable=False)
@@ -217,7 +319,9 @@ class BatchSummary(Base):
     pass_rate = Column(Float, nullable=False)
     execution_time_ms = Column(Float, nullable=False)
     errors_summary = Column(JSON, nullable=True)
-    processed_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    processed_at = Column(
+        DateTime, default=datetime.utcnow, server_default=utcnow(), nullable=False
+    )
 
     contract = relationship("Contract", back_populates="batch_summaries")
 
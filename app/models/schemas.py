@@ -1,9 +1,27 @@
-from typing import Optional, Dict, List, Any, Union
+from typing import Generic, Optional, Dict, List, Any, TypeVar, Union
+from collections import defaultdict
 from datetime import datetime, date
 from uuid import UUID
-from pydantic import BaseModel, Field, field_validator
+from functools import lru_cache
+import heapq
+from pydantic import BaseModel, Field, TypeAdapter, field_validator
 import re
-import yaml
+
+from app.utils.cache import compile_pattern
+
+
+_NAME_RE = re.compile(r"^[a-zA-Z0-9][a-zA-Z0-9-_]*$")
+_DOMAIN_RE = re.compile(r"^[a-z0-9][a-z0-9-]*$")
+_VERSION_RE = re.compile(r"^\d+\.\d+$")
+
+
+# Shared by the yaml_content validator and validate_contract_structure so a
+# request body is parsed once. Results are shared; callers must not mutate.
+@lru_cache(maxsize=128)
+def _load_yaml(content: str) -> Any:
+    import yaml
+
+    return yaml.load(content, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
 
 
 class FieldDefinition(BaseModel):
@@ -53,7 +71,7 @@ class FieldDefinition(BaseModel):
         if v is None:
             return v
         try:
-            re.compile(v)
+            compile_pattern(v)
         except re.error as e:
             raise ValueError(f"Invalid regex pattern: {str(e)}")
         return v
@@ -84,7 +102,7 @@ class ContractSchema(BaseModel):
     @field_validator("contract_version")
     @classmethod
     def validate_version(cls, v):
-        if not re.match(r"^\d+\.\d+$", v):
+        if not _VERSION_RE.match(v):
             raise ValueError("contract_version must be in format 'X.Y' (e.g., '1.0')")
         return v
 
@@ -96,6 +114,33 @@ class ContractSchema(BaseModel):
         return v
 
 
+FIELD_MAP_ADAPTER = TypeAdapter(Dict[str, FieldDefinition])
+
+
+def _check_yaml_syntax(content: str) -> str:
+    import yaml
+
+    try:
+        _load_yaml(content)
+    except yaml.YAMLError as e:
+        raise ValueError(f"Invalid YAML syntax: {str(e)}")
+    return content
+
+
+def _build_contract_schema(content: str) -> ContractSchema:
+    data = _load_yaml(content)
+
+    required_keys = ["contract_version", "schema"]
+    for key in required_keys:
+        if key not in data:
+            raise ValueError(f"Missing required key: '{key}'")
+
+    try:
+        return ContractSchema(**data)
+    except Exception as e:
+        raise ValueError(f"Invalid contract structure: {str(e)}")
+
+
 class ContractCreate(BaseModel):
     name: str = Field(..., min_length=3, max_length=255)
     domain: str = Field(..., min_length=2, max_length=100)
@@ -105,7 +150,7 @@ class ContractCreate(BaseModel):
     @field_validator("name")
     @classmethod
     def validate_name_format(cls, v):
-        if not re.match(r"^[a-zA-Z0-9][a-zA-Z0-9-_]*$", v):
+        if not _NAME_RE.match(v):
             raise ValueError(
                 "Name must start with alphanumeric and contain only "
                 "alphanumeric characters, dashes, and underscores"
@@ -115,7 +160,7 @@ class ContractCreate(BaseModel):
     @field_validator("domain")
     @classmethod
     def validate_domain_format(cls, v):
-        if not re.match(r"^[a-z0-9][a-z0-9-]*$", v):
+        if not _DOMAIN_RE.match(v):
             raise ValueError(
                 "Domain must be lowercase, start with alphanumeric, "
                 "and contain only lowercase alphanumeric and dashes"
@@ -125,24 +170,10 @@ class ContractCreate(BaseModel):
     @field_validator("yaml_content")
     @classmethod
     def validate_yaml_syntax(cls, v):
-        try:
-            yaml.safe_load(v)
-        except yaml.YAMLError as e:
-            raise ValueError(f"Invalid YAML syntax: {str(e)}")
-        return v
+        return _check_yaml_syntax(v)
 
     def validate_contract_structure(self) -> ContractSchema:
-        data = yaml.safe_load(self.yaml_content)
-
-        required_keys = ["contract_version", "schema"]
-        for key in required_keys:
-            if key not in data:
-                raise ValueError(f"Missing required key: '{key}'")
-
-        try:
-            return ContractSchema(**data)
-        except Exception as e:
-            raise ValueError(f"Invalid contract structure: {str(e)}")
+        return _build_contract_schema(self.yaml_content)
 
 
 class ContractUpdate(BaseModel):
@@ -152,24 +183,10 @@ class ContractUpdate(BaseModel):
     @field_validator("yaml_content")
     @classmethod
     def validate_yaml_syntax(cls, v):
-        try:
-            yaml.safe_load(v)
-        except yaml.YAMLError as e:
-            raise ValueError(f"Invalid YAML syntax: {str(e)}")
-        return v
+        return _check_yaml_syntax(v)
 
     def validate_contract_structure(self) -> ContractSchema:
-        data = yaml.safe_load(self.yaml_content)
-
-        required_keys = ["contract_version", "schema"]
-        for key in required_keys:
-            if key not in data:
-                raise ValueError(f"Missing required key: '{key}'")
-
-        try:
-            return ContractSchema(**data)
-        except Exception as e:
-            raise ValueError(f"Invalid contract structure: {str(e)}")
+        return _build_contract_schema(self.yaml_content)
 
 
 class ContractResponse(BaseModel):
@@ -185,32 +202,22 @@ class ContractResponse(BaseModel):
 
     model_config = {"from_attributes": True}
 
-    @classmethod
-    def from_db_model(cls, db_model):
-        return cls(
-            id=str(db_model.id),
-            name=db_model.name,
-            version=db_model.version,
-            domain=db_model.domain,
-            yaml_content=db_model.yaml_content,
-            description=db_model.description,
-            is_active=db_model.is_active,
-            created_at=db_model.created_at,
-            updated_at=db_model.updated_at,
-        )
 
+CONTRACT_LIST_ADAPTER = TypeAdapter(List[ContractResponse])
+
+
+ContractItem = TypeVar("ContractItem", bound=BaseModel)
 
-class ContractList(BaseModel):
-    contracts: List[ContractResponse]
+
+class _ContractPage(BaseModel, Generic[ContractItem]):
+    contracts: List[ContractItem]
     total: int
     page: int = 1
     page_size: int = 50
     has_next: bool = False
 
     @classmethod
-    def paginate(
-        cls, contracts: List[ContractResponse], total: int, skip: int, limit: int
-    ):
+    def paginate(cls, contracts: List[ContractItem], total: int, skip: int, limit: int):
         page = (skip // limit) + 1
         has_next = (skip + limit) < total
 
@@ -223,6 +230,10 @@ class ContractList(BaseModel):
         )
 
 
+class ContractList(_ContractPage[ContractResponse]):
+    pass
+
+
 class ContractSummary(BaseModel):
     id: str
     name: str
@@ -234,6 +245,10 @@ class ContractSummary(BaseModel):
     model_config = {"from_attributes": True}
 
 
+class ContractSummaryList(_ContractPage[ContractSummary]):
+    pass
+
+
 class ContractTemplate(BaseModel):
     name: str
     description: str
@@ -295,12 +310,10 @@ class ValidationResult(BaseModel):
         return len(self.errors)
 
     def errors_by_type(self) -> Dict[str, List[ValidationError]]:
-        result = {}
+        result = defaultdict(list)
         for error in self.errors:
-            if error.error_type not in result:
-                result[error.error_type] = []
             result[error.error_type].append(error)
-        return result
+        return dict(result)
 
 
 class ValidationRequest(BaseModel):
@@ -318,10 +331,7 @@ class BatchValidationResult(BaseModel):
     batch_id: str
 
     def get_top_errors(self, n: int = 10) -> List[tuple]:
-        sorted_errors = sorted(
-            self.errors_summary.items(), key=lambda x: x[1], reverse=True
-        )
-        return sorted_errors[:n]
+        return heapq.nlargest(n, self.errors_summary.items(), key=lambda x: x[1])
 
 
 class ValidationHistoryResponse(BaseModel):
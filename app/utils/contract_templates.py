@@ -112,29 +112,33 @@ quality_rules:
 """
 
 
+_ALL_TEMPLATES = [
+    ContractTemplate(
+        name="basic-user-events",
+        description="Basic user analytics events with user ID and email",
+        domain="user-analytics",
+        yaml_content=BASIC_USER_EVENTS,
+    ),
+    ContractTemplate(
+        name="ecommerce-orders",
+        description="E-commerce order events with line items",
+        domain="e-commerce",
+        yaml_content=ECOMMERCE_ORDERS,
+    ),
+    ContractTemplate(
+        name="iot-sensor-data",
+        description="IoT sensor readings with device tracking",
+        domain="iot",
+        yaml_content=IOT_SENSOR_DATA,
+    ),
+]
+
+_TEMPLATES_BY_NAME = {t.name: t for t in _ALL_TEMPLATES}
+
+
 def get_all_templates() -> List[ContractTemplate]:
-    return [
-        ContractTemplate(
-            name="basic-user-events",
-            description="Basic user analytics events with user ID and email",
-            domain="user-analytics",
-            yaml_content=BASIC_USER_EVENTS,
-        ),
-        ContractTemplate(
-            name="ecommerce-orders",
-            description="E-commerce order events with line items",
-            domain="e-commerce",
-            yaml_content=ECOMMERCE_ORDERS,
-        ),
-        ContractTemplate(
-            name="iot-sensor-data",
-            description="IoT sensor readings with device tracking",
-            domain="iot",
-            yaml_content=IOT_SENSOR_DATA,
-        ),
-    ]
+    return list(_ALL_TEMPLATES)
 
 
 def get_template_by_name(name: str) -> ContractTemplate:
-    templates = {t.name: t for t in get_all_templates()}
-    return templates.get(name)
+    return _TEMPLATES_BY_NAME.get(name)
@@ -1,8 +1,15 @@
-from typing import Optional, Dict, Any
-from datetime import datetime
+import time
+from typing import ClassVar, Optional, Dict, Any
+from datetime import datetime, timezone
 
 
 class DCEBaseException(Exception):
+    _error_name: ClassVar[str] = "DCEBaseException"
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._error_name = cls.__name__
+
     def __init__(
         self,
         message: str,
@@ -16,7 +23,7 @@ class DCEBaseException(Exception):
 
     def to_dict(self) -> Dict[str, Any]:
         return {
-            "error": self.__class__.__name__,
+            "error": self._error_name,
             "message": self.message,
             "details": self.details,
         }
@@ -291,6 +298,22 @@ class SchedulerError(DCEBaseException):
         )
 
 
+_error_timestamp_second: Optional[int] = None
+_error_timestamp = ""
+
+
+def current_error_timestamp() -> str:
+    """Return the current UTC time as ISO 8601, formatted at most once a second."""
+    global _error_timestamp_second, _error_timestamp
+
+    second = int(time.time())
+    if second != _error_timestamp_second:
+        _error_timestamp = datetime.fromtimestamp(second, timezone.utc).isoformat()
+        _error_timestamp_second = second
+
+    return _error_timestamp
+
+
 def get_http_status_code(exception: Exception) -> int:
     """Get the HTTP status code for an exception."""
     if isinstance(exception, DCEBaseException):
@@ -311,7 +334,7 @@ def format_error_response(
             "details": {},
         }
 
-    response["timestamp"] = datetime.utcnow().isoformat()
+    response["timestamp"] = current_error_timestamp()
 
     if path:
         response["path"] = path
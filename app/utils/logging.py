@@ -3,11 +3,19 @@ Logging configuration for the application.
 Provides structured logging with color formatting.
 """
 
+import atexit
 import logging
+import queue
 import sys
 from datetime import datetime
+from logging.handlers import (
+    MemoryHandler,
+    QueueHandler,
+    QueueListener,
+    RotatingFileHandler,
+)
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
 from app.config import settings
 
@@ -45,20 +53,61 @@ class ColoredFormatter(logging.Formatter):
         + LogColors.RESET,
     }
 
+    DATEFMT = "%Y-%m-%d %H:%M:%S"
+
+    def __init__(self):
+        super().__init__(datefmt=self.DATEFMT)
+        # Build one formatter per level up front instead of one per record
+        self._formatters = {
+            level: logging.Formatter(log_fmt, datefmt=self.DATEFMT)
+            for level, log_fmt in self.FORMATS.items()
+        }
+        self._default = logging.Formatter(datefmt=self.DATEFMT)
+
     def format(self, record):
-        log_fmt = self.FORMATS.get(record.levelno)
-        formatter = logging.Formatter(log_fmt, datefmt="%Y-%m-%d %H:%M:%S")
-        return formatter.format(record)
+        return self._formatters.get(record.levelno, self._default).format(record)
+
+
+LOG_FILE_MAX_BYTES = 50 * 1024 * 1024
+LOG_FILE_BACKUP_COUNT = 7
+LOG_BUFFER_CAPACITY = 1024
+
+# Background listener that owns the real handlers; see setup_logging
+_queue_listener: Optional[QueueListener] = None
+
+
+def _stop_queue_listener() -> None:
+    """Flush pending records and close the handlers behind the queue."""
+    global _queue_listener
+
+    if _queue_listener is None:
+        return
+
+    _queue_listener.stop()
+    for handler in _queue_listener.handlers:
+        handler.close()
+        if isinstance(handler, MemoryHandler) and handler.target is not None:
+            handler.target.close()
+    _queue_listener = None
+
+
+atexit.register(_stop_queue_listener)
 
 
 def setup_logging(log_level: Optional[str] = None) -> None:
     """
     Setup logging configuration for the application.
 
+    Records are put on a queue by the calling thread and written to the
+    console and log file by a background QueueListener, so request
+    handlers never block on log I/O.
+
     Args:
         log_level: Log level (DEBUG, INFO, WARNING, ERROR, CRITICAL).
                   If None, uses settings.LOG_LEVEL.
     """
+    global _queue_listener
+
     # Determine log level
     level = log_level or settings.LOG_LEVEL
     numeric_level = getattr(logging, level.upper(), logging.INFO)
@@ -72,25 +121,41 @@ def setup_logging(log_level: Optional[str] = None) -> None:
     root_logger.setLevel(numeric_level)
 
     # Remove existing handlers
+    _stop_queue_listener()
     root_logger.handlers = []
+    handlers: List[logging.Handler] = []
 
     # Console handler with color formatting
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(numeric_level)
     console_handler.setFormatter(ColoredFormatter())
-    root_logger.addHandler(console_handler)
+    handlers.append(console_handler)
 
     # File handler (without colors)
     if settings.is_production or True:  # Always log to file
         log_file = log_dir / f"dce_{datetime.now().strftime('%Y%m%d')}.log"
-        file_handler = logging.FileHandler(log_file)
+        file_handler = RotatingFileHandler(
+            log_file, maxBytes=LOG_FILE_MAX_BYTES, backupCount=LOG_FILE_BACKUP_COUNT
+        )
         file_handler.setLevel(numeric_level)
         file_formatter = logging.Formatter(
             "%(asctime)s | %(levelname)-8s | %(name)s | %(message)s",
             datefmt="%Y-%m-%d %H:%M:%S",
         )
         file_handler.setFormatter(file_formatter)
-        root_logger.addHandler(file_handler)
+
+        # Batch file writes; errors flush immediately with everything before them
+        buffered_handler = MemoryHandler(
+            LOG_BUFFER_CAPACITY, flushLevel=logging.ERROR, target=file_handler
+        )
+        buffered_handler.setLevel(numeric_level)
+        handlers.append(buffered_handler)
+
+    # Hand records to the listener thread instead of writing inline
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    root_logger.addHandler(QueueHandler(log_queue))
+    _queue_listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _queue_listener.start()
 
     # Log startup message
     root_logger.info(f"Logging initialized at {level.upper()} level")
@@ -0,0 +1,63 @@
+import hashlib
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+class ETagMiddleware:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] != "GET":
+            await self.app(scope, receive, send)
+            return
+
+        if_none_match = Headers(scope=scope).get("if-none-match")
+        start_message: Message = {}
+        body_parts = []
+        buffering = True
+
+        async def send_with_etag(message: Message) -> None:
+            nonlocal buffering
+
+            if message["type"] == "http.response.start":
+                headers = Headers(raw=message["headers"])
+                content_type = headers.get("content-type", "")
+                if message["status"] != 200 or not content_type.startswith(
+                    "application/json"
+                ):
+                    buffering = False
+                    await send(message)
+                    return
+                start_message.update(message)
+                return
+
+            if not buffering:
+                await send(message)
+                return
+
+            body_parts.append(message.get("body", b""))
+            if message.get("more_body", False):
+                return
+
+            body = b"".join(body_parts)
+            etag = f'W/"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+            if if_none_match == etag:
+                await send(
+                    {
+                        "type": "http.response.start",
+                        "status": 304,
+                        "headers": [(b"etag", etag.encode("latin-1"))],
+                    }
+                )
+                await send({"type": "http.response.body", "body": b""})
+                return
+
+            headers = MutableHeaders(raw=start_message["headers"])
+            headers["ETag"] = etag
+            await send(start_message)
+            await send({"type": "http.response.body", "body": body})
+
+        await self.app(scope, receive, send_with_etag)
@@ -3,14 +3,19 @@ from apscheduler.triggers.cron import CronTrigger
 import logging
 from datetime import datetime, timedelta
 
-from app.database import get_db_session
+from sqlalchemy import delete, select
+
+from app.database import engine, get_db_session
 from app.core.metrics_aggregator import MetricsAggregator
+from app.core.partitions import drop_expired_partitions, ensure_partitions
 from app.models.database import ValidationResult
 
 
 logger = logging.getLogger(__name__)
 scheduler = AsyncIOScheduler()
 
+CLEANUP_BATCH_SIZE = 10000
+
 
 def setup_scheduler():
     scheduler.add_job(
@@ -29,11 +34,19 @@ def setup_scheduler():
         replace_existing=True,
     )
 
+    scheduler.add_job(
+        ensure_partitions_job,
+        CronTrigger(hour=0, minute=30),
+        id="ensure_partitions",
+        name="Create upcoming validation result partitions",
+        replace_existing=True,
+    )
+
     scheduler.start()
     logger.info("Scheduler started")
 
 
-async def aggregate_daily_metrics_job():
+def aggregate_daily_metrics_job():
     logger.info("Starting daily metrics aggregation")
 
     db = get_db_session()
@@ -48,7 +61,38 @@ async def aggregate_daily_metrics_job():
         db.close()
 
 
-async def cleanup_old_data_job():
+def ensure_partitions_job():
+    try:
+        ensure_partitions(engine)
+    except Exception as e:
+        logger.error(f"Partition maintenance failed: {e}")
+
+
+def delete_expired_validation_results(
+    db, cutoff_date: datetime, batch_size: int = CLEANUP_BATCH_SIZE
+) -> int:
+    expired_ids = (
+        select(ValidationResult.id)
+        .where(ValidationResult.validated_at < cutoff_date)
+        .limit(batch_size)
+        .scalar_subquery()
+    )
+    stmt = (
+        delete(ValidationResult)
+        .where(ValidationResult.id.in_(expired_ids))
+        .execution_options(synchronize_session=False)
+    )
+
+    deleted_count = 0
+    while True:
+        deleted = db.execute(stmt).rowcount
+        db.commit()
+        deleted_count += deleted
+        if deleted < batch_size:
+            return deleted_count
+
+
+def cleanup_old_data_job():
     logger.info("Starting data cleanup")
 
     db = get_db_session()
@@ -56,13 +100,9 @@ async def cleanup_old_data_job():
     cutoff_date = datetime.utcnow() - timedelta(days=retention_days)
 
     try:
-        deleted_count = (
-            db.query(ValidationResult)
-            .filter(ValidationResult.validated_at < cutoff_date)
-            .delete()
-        )
+        drop_expired_partitions(engine, cutoff_date)
 
-        db.commit()
+        deleted_count = delete_expired_validation_results(db, cutoff_date)
         logger.info(f"Cleaned up {deleted_count} old validation results")
     except Exception as e:
         logger.error(f"Data cleanup failed: {e}")
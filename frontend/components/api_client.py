@@ -1,28 +1,81 @@
+import threading
+from collections import OrderedDict
+
+import orjson
 import requests
-from typing import Dict, List, Optional, Any
-import json
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import BinaryIO, Dict, Iterator, List, Optional, Any, Tuple
+
+# One client is shared by every Streamlit session, so size the pool for concurrent reruns
+POOL_MAXSIZE = 100
+# Responses kept for If-None-Match revalidation, least recently used evicted first
+ETAG_CACHE_SIZE = 256
 
 class APIClient:
     def __init__(self, base_url: str):
         self.base_url = base_url
         self.session = requests.Session()
         self.session.headers.update({"Content-Type": "application/json"})
+        retries = Retry(
+            total=3,
+            backoff_factor=0.2,
+            status_forcelist=[502, 503, 504],
+            allowed_methods=["GET", "HEAD", "OPTIONS"],
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_maxsize=POOL_MAXSIZE, max_retries=retries)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self._etag_cache: "OrderedDict[Tuple[str, frozenset], Tuple[str, Any]]" = OrderedDict()
+        self._etag_lock = threading.Lock()
     
     def _request(self, method: str, endpoint: str, **kwargs) -> Any:
         url = f"{self.base_url}/{endpoint}"
+        if "json" in kwargs:
+            kwargs["data"] = orjson.dumps(kwargs.pop("json"))
+        
+        cache_key = cached = None
+        if method == "GET":
+            cache_key = (url, frozenset((kwargs.get("params") or {}).items()))
+            cached = self._etag_get(cache_key)
+            if cached:
+                kwargs["headers"] = {"If-None-Match": cached[0]}
+        
         try:
             response = self.session.request(method, url, **kwargs)
             response.raise_for_status()
-            return response.json()
+            if response.status_code == 304 and cached:
+                return cached[1]
+            
+            result = orjson.loads(response.content)
+            etag = response.headers.get("ETag")
+            if cache_key and etag:
+                self._etag_put(cache_key, (etag, result))
+            return result
         except requests.exceptions.HTTPError as e:
             error_msg = f"{e}"
             try:
-                error_detail = response.json()
+                error_detail = orjson.loads(response.content)
                 error_msg = f"{e} - {error_detail}"
             except:
                 pass
             raise Exception(error_msg)
     
+    def _etag_get(self, key: Tuple[str, frozenset]) -> Optional[Tuple[str, Any]]:
+        with self._etag_lock:
+            cached = self._etag_cache.get(key)
+            if cached:
+                self._etag_cache.move_to_end(key)
+            return cached
+    
+    def _etag_put(self, key: Tuple[str, frozenset], value: Tuple[str, Any]):
+        with self._etag_lock:
+            self._etag_cache[key] = value
+            self._etag_cache.move_to_end(key)
+            if len(self._etag_cache) > ETAG_CACHE_SIZE:
+                self._etag_cache.popitem(last=False)
+    
     def get_contracts(self, domain: Optional[str] = None, limit: int = 100, is_active: bool = True) -> List[Dict]:
         params = {"limit": limit, "is_active": is_active}
         if domain:
@@ -38,6 +91,24 @@ class APIClient:
                 return result["items"]
         return []
     
+    def iter_contracts(self, domain: Optional[str] = None, is_active: bool = True, page_size: int = 50) -> Iterator[Dict]:
+        params = {"skip": 0, "limit": page_size, "is_active": is_active}
+        if domain:
+            params["domain"] = domain
+        while True:
+            result = self._request("GET", "contracts", params=params)
+            yield from result.get("contracts", [])
+            if not result.get("has_next"):
+                return
+            params["skip"] += page_size
+    
+    def get_contract_summaries(self, domain: Optional[str] = None, limit: int = 100, is_active: bool = True) -> List[Dict]:
+        params = {"limit": limit, "is_active": is_active}
+        if domain:
+            params["domain"] = domain
+        result = self._request("GET", "contracts/summaries", params=params)
+        return result.get("contracts", []) if isinstance(result, dict) else []
+    
     def get_contract(self, contract_id: str) -> Dict:
         return self._request("GET", f"contracts/{contract_id}")
     
@@ -65,14 +136,16 @@ class APIClient:
         payload = {"data": data}
         return self._request("POST", f"validate/{contract_id}", json=payload)
     
-    def validate_batch(self, contract_id: str, file_content: str, file_type: str) -> Dict:
-        import base64
-        encoded = base64.b64encode(file_content.encode()).decode()
-        payload = {
-            "file_data": encoded,
-            "file_type": file_type
-        }
-        return self._request("POST", f"validate/{contract_id}/batch", json=payload)
+    def validate_batch(self, contract_id: str, file: BinaryIO, file_type: str) -> Dict:
+        file_name = getattr(file, "name", f"data.{file_type}")
+        files = {"file": (file_name, file, "application/octet-stream")}
+        return self._request(
+            "POST",
+            f"validate/{contract_id}/batch/file",
+            files=files,
+            data={"file_type": file_type},
+            headers={"Content-Type": None},
+        )
     
     def get_validation_results(self, contract_id: str, limit: int = 100) -> List[Dict]:
         params = {"limit": limit}
@@ -0,0 +1,60 @@
+import pandas as pd
+import streamlit as st
+from typing import Dict, List, Optional, Tuple
+
+CACHE_TTL_SECONDS = 30
+
+METRIC_DEFAULTS = {
+    'total_validations': 0,
+    'passed': 0,
+    'failed': 0,
+    'pass_rate': 0.0,
+    'quality_score': 0.0,
+    'avg_execution_time_ms': 0.0
+}
+
+
+@st.cache_data(ttl=CACHE_TTL_SECONDS, show_spinner=False)
+def get_contracts(_api_client, domain: Optional[str] = None, is_active: bool = True) -> List[Dict]:
+    return list(_api_client.iter_contracts(domain=domain, is_active=is_active))
+
+
+@st.cache_data(ttl=CACHE_TTL_SECONDS, show_spinner=False)
+def get_contract_summaries(_api_client) -> List[Dict]:
+    return _api_client.get_contract_summaries()
+
+
+@st.cache_data(ttl=CACHE_TTL_SECONDS, show_spinner=False)
+def get_daily_metrics_frame(_api_client, contract_id: str, days: int = 30) -> Tuple[pd.DataFrame, Dict[str, int]]:
+    metrics = _api_client.get_daily_metrics(contract_id, days)
+    if not metrics:
+        return pd.DataFrame(), {}
+    
+    df = pd.DataFrame.from_records(metrics).rename(columns={"metric_date": "date"})
+    for column, default in METRIC_DEFAULTS.items():
+        if column not in df.columns:
+            df[column] = default
+        else:
+            df[column] = df[column].fillna(default)
+    df['date'] = pd.to_datetime(df['date'])
+    df = df.sort_values('date')
+    
+    all_errors = {}
+    if 'top_errors' in df.columns:
+        # Each day's top_errors is an {error_type: count} mapping; one column per type
+        daily_errors = [errors for errors in df['top_errors'] if isinstance(errors, dict) and errors]
+        if daily_errors:
+            all_errors = pd.DataFrame.from_records(daily_errors).sum().astype("int64").to_dict()
+    
+    return df, all_errors
+
+
+@st.cache_data(ttl=CACHE_TTL_SECONDS, show_spinner=False)
+def get_platform_summary(_api_client) -> Dict:
+    return _api_client.get_platform_summary()
+
+
+def clear_contract_caches():
+    get_contracts.clear()
+    get_contract_summaries.clear()
+    get_platform_summary.clear()
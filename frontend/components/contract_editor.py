@@ -1,11 +1,13 @@
 import streamlit as st
 
 class ContractEditor:
+    TIP = "💡 **Tip:** Use YAML format for contract definition."
+    
     def __init__(self, initial_content: str = ""):
         self.initial_content = initial_content
     
     def render(self) -> str:
-        st.markdown("💡 **Tip:** Use YAML format for contract definition.")
+        st.markdown(self.TIP)
         
         content = st.text_area(
             "Contract YAML",
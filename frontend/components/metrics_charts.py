@@ -1,8 +1,20 @@
 import plotly.express as px
 import plotly.graph_objects as go
+import plotly.io as pio
 import pandas as pd
 from typing import Dict
 
+pio.templates["dce_transparent"] = go.layout.Template(
+    layout=go.Layout(
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)'
+    )
+)
+CHART_TEMPLATE = "plotly+dce_transparent"
+
+# Same cut-over plotly express uses for render_mode="auto"
+WEBGL_POINT_THRESHOLD = 1000
+
 class MetricsCharts:
     @staticmethod
     def pass_rate_line(df: pd.DataFrame, title: str = "Pass Rate Trend") -> go.Figure:
@@ -16,8 +28,7 @@ class MetricsCharts:
         fig.update_traces(line_color='#00CC96', line_width=3)
         fig.update_layout(
             hovermode='x unified',
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)'
+            template=CHART_TEMPLATE
         )
         return fig
     
@@ -47,8 +58,7 @@ class MetricsCharts:
             xaxis_title='Date',
             yaxis_title='Count',
             hovermode='x unified',
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)'
+            template=CHART_TEMPLATE
         )
         
         return fig
@@ -57,7 +67,8 @@ class MetricsCharts:
     def quality_score_area(df: pd.DataFrame, title: str = "Quality Score") -> go.Figure:
         fig = go.Figure()
         
-        fig.add_trace(go.Scatter(
+        scatter = go.Scattergl if len(df) > WEBGL_POINT_THRESHOLD else go.Scatter
+        fig.add_trace(scatter(
             x=df['date'],
             y=df['quality_score'],
             fill='tozeroy',
@@ -74,18 +85,17 @@ class MetricsCharts:
             yaxis_title='Score',
             yaxis_range=[0, 100],
             hovermode='x unified',
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)'
+            template=CHART_TEMPLATE
         )
         
         return fig
     
     @staticmethod
     def error_distribution_bar(error_counts: Dict[str, int], title: str = "Error Distribution") -> go.Figure:
-        df = pd.DataFrame([
-            {"error_type": k, "count": v}
-            for k, v in sorted(error_counts.items(), key=lambda x: x[1], reverse=True)
-        ])
+        df = pd.DataFrame({
+            "error_type": list(error_counts.keys()),
+            "count": list(error_counts.values())
+        }).sort_values("count", ascending=False, kind="stable")
         
         fig = px.bar(
             df,
@@ -101,8 +111,7 @@ class MetricsCharts:
             xaxis_title='Count',
             yaxis_title='Error Type',
             showlegend=False,
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)'
+            template=CHART_TEMPLATE
         )
         
         return fig
@@ -1,7 +1,70 @@
 import streamlit as st
 from components.contract_editor import ContractEditor
+from components import cached_api
+import math
 import yaml
 
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+CONTRACTS_PER_PAGE = 20
+
+DOMAINS = ("analytics", "finance", "marketing", "sales", "engineering")
+DOMAIN_FILTERS = ("All",) + DOMAINS
+
+DEFAULT_CONTRACT_YAML = r"""contract_version: "1.0"
+description: "Your contract description"
+
+schema:
+  user_id:
+    type: string
+    required: true
+    pattern: "^usr_\\d+$"
+    description: "Unique user identifier"
+  
+  email:
+    type: string
+    format: email
+    required: true
+    description: "User email address"
+  
+  age:
+    type: integer
+    min: 18
+    max: 120
+    required: false
+    description: "User age"
+
+quality_rules:
+  freshness:
+    max_latency_hours: 2
+  
+  completeness:
+    min_row_count: 1
+    max_null_percentage: 5.0
+  
+  uniqueness:
+    fields: ["user_id"]
+"""
+
+# Button callbacks run before the rerun the click triggers, so state-only
+# actions don't need a second st.rerun() to take effect
+def start_editing(contract):
+    st.session_state.editing_contract = contract
+
+def clear_state(key):
+    st.session_state.pop(key, None)
+
+# Only one page of expanders is built per rerun, however many contracts match
+def page_of(items, key):
+    pages = math.ceil(len(items) / CONTRACTS_PER_PAGE)
+    if pages <= 1:
+        return items
+    if st.session_state.get(key, 1) > pages:
+        st.session_state[key] = pages
+    page = st.number_input(f"Page (of {pages})", min_value=1, max_value=pages, value=1, key=key)
+    start = (page - 1) * CONTRACTS_PER_PAGE
+    return items[start:start + CONTRACTS_PER_PAGE]
+
 st.set_page_config(page_title="Contracts", page_icon="📝", layout="wide")
 
 st.title("📝 Contract Management")
@@ -17,42 +80,48 @@ with tab1:
     with col1:
         search = st.text_input("🔍 Search contracts", key="search_active")
     with col2:
-        domain_filter = st.selectbox("Filter by domain", ["All", "analytics", "finance", "marketing", "sales", "engineering"], key="domain_active")
+        domain_filter = st.selectbox("Filter by domain", DOMAIN_FILTERS, key="domain_active")
     
     try:
-        contracts = api_client.get_contracts(
+        contracts = cached_api.get_contracts(
+            api_client,
             domain=None if domain_filter == "All" else domain_filter,
             is_active=True
         )
         
         if search:
-            contracts = [c for c in contracts if search.lower() in c["name"].lower()]
+            needle = search.lower()
+            contracts = [c for c in contracts if needle in c["name"].lower()]
         
         if not contracts:
             st.info("No active contracts found. Create your first contract in the 'Create Contract' tab!")
         else:
-            for contract in contracts:
+            for contract in page_of(contracts, "page_active"):
                 with st.expander(f"**{contract['name']}** (v{contract['version']})", expanded=False):
                     col1, col2, col3 = st.columns([2, 2, 1])
                     
                     with col1:
-                        st.markdown(f"**Domain:** {contract['domain']}")
-                        st.markdown(f"**Version:** {contract['version']}")
+                        st.markdown(
+                            f"**Domain:** {contract['domain']}  \n"
+                            f"**Version:** {contract['version']}"
+                        )
                     
                     with col2:
-                        st.markdown(f"**Created:** {contract['created_at'][:10]}")
-                        st.markdown(f"**Status:** ✅ Active")
+                        st.markdown(
+                            f"**Created:** {contract['created_at'][:10]}  \n"
+                            "**Status:** ✅ Active"
+                        )
                     
                     with col3:
-                        if st.button("✏️ Edit", key=f"edit_{contract['id']}", use_container_width=True):
-                            st.session_state.editing_contract = contract
-                            st.rerun()
+                        st.button("✏️ Edit", key=f"edit_{contract['id']}", use_container_width=True,
+                                  on_click=start_editing, args=(contract,))
                         
                         if st.button("🗑️ Deactivate", key=f"deactivate_{contract['id']}", 
                                    use_container_width=True,
                                    help="Mark as inactive (can be restored later)"):
                             try:
                                 api_client.delete_contract(contract['id'], hard_delete=False)
+                                cached_api.clear_contract_caches()
                                 st.success(f"✅ Deactivated: {contract['name']}")
                                 st.rerun()
                             except Exception as e:
@@ -71,18 +140,18 @@ with tab1:
                                 if st.button("✅ Yes, Delete", key=f"confirm_yes_{contract['id']}", type="primary"):
                                     try:
                                         api_client.delete_contract(contract['id'], hard_delete=True)
+                                        cached_api.clear_contract_caches()
                                         st.success(f"🗑️ Permanently deleted: {contract['name']}")
                                         del st.session_state[f"confirm_delete_{contract['id']}"]
                                         st.rerun()
                                     except Exception as e:
                                         st.error(f"Failed to delete: {e}")
                             with col_b:
-                                if st.button("❌ Cancel", key=f"confirm_no_{contract['id']}"):
-                                    del st.session_state[f"confirm_delete_{contract['id']}"]
-                                    st.rerun()
+                                st.button("❌ Cancel", key=f"confirm_no_{contract['id']}",
+                                          on_click=clear_state, args=(f"confirm_delete_{contract['id']}",))
                     
-                    st.markdown("**YAML Content:**")
-                    st.code(contract['yaml_content'], language="yaml")
+                    if st.toggle("Show YAML", key=f"show_yaml_{contract['id']}"):
+                        st.code(contract['yaml_content'], language="yaml")
     
     except Exception as e:
         st.error(f"Failed to load contracts: {e}")
@@ -102,6 +171,7 @@ with tab1:
                         st.session_state.editing_contract['id'],
                         new_yaml
                     )
+                    cached_api.clear_contract_caches()
                     st.success(f"Updated to version {result['contract']['version']}")
                     del st.session_state.editing_contract
                     st.rerun()
@@ -109,9 +179,7 @@ with tab1:
                     st.error(f"Failed to update: {e}")
         
         with col2:
-            if st.button("Cancel"):
-                del st.session_state.editing_contract
-                st.rerun()
+            st.button("Cancel", on_click=clear_state, args=("editing_contract",))
 
 with tab2:
     st.subheader("Inactive Contracts")
@@ -121,31 +189,37 @@ with tab2:
     with col1:
         search_inactive = st.text_input("🔍 Search inactive contracts", key="search_inactive")
     with col2:
-        domain_filter_inactive = st.selectbox("Filter by domain", ["All", "analytics", "finance", "marketing", "sales", "engineering"], key="domain_inactive")
+        domain_filter_inactive = st.selectbox("Filter by domain", DOMAIN_FILTERS, key="domain_inactive")
     
     try:
-        inactive_contracts = api_client.get_contracts(
+        inactive_contracts = cached_api.get_contracts(
+            api_client,
             domain=None if domain_filter_inactive == "All" else domain_filter_inactive,
             is_active=False
         )
         
         if search_inactive:
-            inactive_contracts = [c for c in inactive_contracts if search_inactive.lower() in c["name"].lower()]
+            needle = search_inactive.lower()
+            inactive_contracts = [c for c in inactive_contracts if needle in c["name"].lower()]
         
         if not inactive_contracts:
             st.info("No inactive contracts found.")
         else:
-            for contract in inactive_contracts:
+            for contract in page_of(inactive_contracts, "page_inactive"):
                 with st.expander(f"**{contract['name']}** (v{contract['version']}) - ⚠️ Inactive", expanded=False):
                     col1, col2, col3 = st.columns([2, 2, 1])
                     
                     with col1:
-                        st.markdown(f"**Domain:** {contract['domain']}")
-                        st.markdown(f"**Version:** {contract['version']}")
+                        st.markdown(
+                            f"**Domain:** {contract['domain']}  \n"
+                            f"**Version:** {contract['version']}"
+                        )
                     
                     with col2:
-                        st.markdown(f"**Created:** {contract['created_at'][:10]}")
-                        st.markdown(f"**Status:** ❌ Inactive")
+                        st.markdown(
+                            f"**Created:** {contract['created_at'][:10]}  \n"
+                            "**Status:** ❌ Inactive"
+                        )
                     
                     with col3:
                         if st.button("♻️ Restore", key=f"restore_{contract['id']}", 
@@ -153,6 +227,7 @@ with tab2:
                                    help="Restore this contract to active status"):
                             try:
                                 api_client.activate_contract(contract['id'])
+                                cached_api.clear_contract_caches()
                                 st.success(f"✅ Restored: {contract['name']}")
                                 st.rerun()
                             except Exception as e:
@@ -171,18 +246,18 @@ with tab2:
                                 if st.button("✅ Yes, Delete", key=f"confirm_yes_inactive_{contract['id']}", type="primary"):
                                     try:
                                         api_client.delete_contract(contract['id'], hard_delete=True)
+                                        cached_api.clear_contract_caches()
                                         st.success(f"🗑️ Permanently deleted: {contract['name']}")
                                         del st.session_state[f"confirm_delete_inactive_{contract['id']}"]
                                         st.rerun()
                                     except Exception as e:
                                         st.error(f"Failed to delete: {e}")
                             with col_b:
-                                if st.button("❌ Cancel", key=f"confirm_no_inactive_{contract['id']}"):
-                                    del st.session_state[f"confirm_delete_inactive_{contract['id']}"]
-                                    st.rerun()
+                                st.button("❌ Cancel", key=f"confirm_no_inactive_{contract['id']}",
+                                          on_click=clear_state, args=(f"confirm_delete_inactive_{contract['id']}",))
                     
-                    st.markdown("**YAML Content:**")
-                    st.code(contract['yaml_content'], language="yaml")
+                    if st.toggle("Show YAML", key=f"show_yaml_inactive_{contract['id']}"):
+                        st.code(contract['yaml_content'], language="yaml")
     
     except Exception as e:
         st.error(f"Failed to load inactive contracts: {e}")
@@ -194,49 +269,14 @@ with tab3:
     
     with col1:
         name = st.text_input("Contract Name *", placeholder="user-events")
-        domain = st.selectbox("Domain *", ["analytics", "finance", "marketing", "sales", "engineering"])
+        domain = st.selectbox("Domain *", DOMAINS)
     
     with col2:
         description = st.text_area("Description", placeholder="Describe this contract...")
     
     st.markdown("**Contract Definition (YAML) *:**")
     
-    default_yaml = r"""contract_version: "1.0"
-description: "Your contract description"
-
-schema:
-  user_id:
-    type: string
-    required: true
-    pattern: "^usr_\\d+$"
-    description: "Unique user identifier"
-  
-  email:
-    type: string
-    format: email
-    required: true
-    description: "User email address"
-  
-  age:
-    type: integer
-    min: 18
-    max: 120
-    required: false
-    description: "User age"
-
-quality_rules:
-  freshness:
-    max_latency_hours: 2
-  
-  completeness:
-    min_row_count: 1
-    max_null_percentage: 5.0
-  
-  uniqueness:
-    fields: ["user_id"]
-"""
-    
-    editor = ContractEditor(default_yaml)
+    editor = ContractEditor(DEFAULT_CONTRACT_YAML)
     yaml_content = editor.render()
     
     if st.button("✨ Create Contract", type="primary"):
@@ -246,8 +286,9 @@ quality_rules:
             st.error("Please provide YAML content")
         else:
             try:
-                yaml.safe_load(yaml_content)
+                yaml.load(yaml_content, Loader=YAML_LOADER)
                 result = api_client.create_contract(name, domain, yaml_content, description)
+                cached_api.clear_contract_caches()
                 st.success(f"Created contract: {result['name']} (v{result['version']})")
                 st.balloons()
             except yaml.YAMLError as e:
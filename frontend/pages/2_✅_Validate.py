@@ -2,6 +2,7 @@ import streamlit as st
 import json
 import pandas as pd
 from components.validation_display import ValidationDisplay
+from components import cached_api
 
 st.set_page_config(page_title="Validate", page_icon="✅", layout="wide")
 
@@ -10,7 +11,7 @@ st.title("✅ Data Validation")
 api_client = st.session_state.api_client
 
 try:
-    contracts = api_client.get_contracts()
+    contracts = cached_api.get_contract_summaries(api_client)
     contract_names = {c["name"]: c["id"] for c in contracts}
     
     if not contracts:
@@ -77,10 +78,8 @@ with tab2:
         
         if st.button("🚀 Validate Batch", type="primary"):
             try:
-                file_content = uploaded_file.read().decode('utf-8')
-                
                 with st.spinner("Processing batch..."):
-                    result = api_client.validate_batch(contract_id, file_content, file_type)
+                    result = api_client.validate_batch(contract_id, uploaded_file, file_type)
                 
                 st.success("Batch validation complete!")
                 
@@ -123,22 +122,21 @@ with tab3:
         if not results:
             st.info("No validation results yet.")
         else:
-            df_data = []
-            for r in results:
-                errors = r.get("errors", []) if r.get("errors") is not None else []
-
-                df_data.append({
-                    "Timestamp": r["validated_at"][:19],
-                    "Status": r["status"],
-                    "Errors": len(errors),
-                    "Execution (ms)": f"{r['execution_time_ms']:.2f}"
-                })
-            
-            df = pd.DataFrame(df_data)
+            df = pd.DataFrame.from_records(
+                results, columns=["validated_at", "status", "errors", "execution_time_ms"]
+            )
+            df["validated_at"] = df["validated_at"].str.slice(0, 19)
+            df["errors"] = df["errors"].str.len().fillna(0).astype(int)
+            df["execution_time_ms"] = df["execution_time_ms"].map("{:.2f}".format)
+            df = df.rename(columns={
+                "validated_at": "Timestamp",
+                "status": "Status",
+                "errors": "Errors",
+                "execution_time_ms": "Execution (ms)"
+            })
             st.dataframe(df, use_container_width=True)
             
-            pass_count = sum(1 for r in results if r["status"] == "PASS")
-            pass_rate = (pass_count / len(results)) * 100
+            pass_rate = df["Status"].eq("PASS").mean() * 100
             
             st.metric("Recent Pass Rate", f"{pass_rate:.1f}%")
     
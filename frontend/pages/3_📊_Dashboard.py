@@ -1,6 +1,6 @@
 import streamlit as st
-import pandas as pd
 from components.metrics_charts import MetricsCharts
+from components import cached_api
 
 st.set_page_config(page_title="Dashboard", page_icon="📊", layout="wide")
 
@@ -9,7 +9,7 @@ st.title("📊 Quality Metrics Dashboard")
 api_client = st.session_state.api_client
 
 try:
-    contracts = api_client.get_contracts()
+    contracts = cached_api.get_contract_summaries(api_client)
     
     if not contracts:
         st.warning("No contracts available.")
@@ -26,35 +26,12 @@ except Exception as e:
 days = st.slider("Time Range (days)", 7, 90, 30)
 
 try:
-    metrics = api_client.get_daily_metrics(contract_id, days)
+    df, all_errors = cached_api.get_daily_metrics_frame(api_client, contract_id, days)
     
-    if not metrics:
+    if df.empty:
         st.info("No metrics data available yet. Start validating data to see metrics!")
         st.stop()
     
-    # FIX: Properly handle the metrics data structure
-    metrics_data = []
-    for metric in metrics:
-        row = {
-            'date': metric.get('metric_date'),
-            'total_validations': metric.get('total_validations', 0),
-            'passed': metric.get('passed', 0),
-            'failed': metric.get('failed', 0),
-            'pass_rate': metric.get('pass_rate', 0.0),
-            'quality_score': metric.get('quality_score', 0.0),
-            'avg_execution_time_ms': metric.get('avg_execution_time_ms', 0.0)
-        }
-        
-        # Handle top_errors which might be a list of tuples
-        if 'top_errors' in metric:
-            row['top_errors'] = metric['top_errors']
-        
-        metrics_data.append(row)
-    
-    df = pd.DataFrame(metrics_data)
-    df['date'] = pd.to_datetime(df['date'])
-    df = df.sort_values('date')
-    
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
@@ -94,14 +71,6 @@ try:
     if 'top_errors' in df.columns:
         st.subheader("Top Error Types")
         
-        all_errors = {}
-        for errors_list in df['top_errors']:
-            if errors_list and isinstance(errors_list, list):
-                for error_item in errors_list:
-                    if isinstance(error_item, (list, tuple)) and len(error_item) == 2:
-                        error_type, count = error_item
-                        all_errors[error_type] = all_errors.get(error_type, 0) + count
-        
         if all_errors:
             fig = MetricsCharts.error_distribution_bar(all_errors)
             st.plotly_chart(fig, use_container_width=True)
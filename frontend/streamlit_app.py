@@ -1,5 +1,6 @@
 import streamlit as st
 from components.api_client import APIClient
+from components import cached_api
 import os
 
 st.set_page_config(
@@ -9,9 +10,13 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+@st.cache_resource
+def get_api_client(api_base_url: str) -> APIClient:
+    return APIClient(api_base_url)
+
 if "api_client" not in st.session_state:
     api_base_url = os.getenv("API_BASE_URL", "http://localhost:8000/api/v1")
-    st.session_state.api_client = APIClient(api_base_url)
+    st.session_state.api_client = get_api_client(api_base_url)
 
 st.title("📋 Data Contract Engine")
 st.markdown("### Automated Data Quality Enforcement")
@@ -19,7 +24,7 @@ st.markdown("### Automated Data Quality Enforcement")
 col1, col2, col3 = st.columns(3)
 
 try:
-    summary = st.session_state.api_client.get_platform_summary()
+    summary = cached_api.get_platform_summary(st.session_state.api_client)
     
     with col1:
         st.metric("Total Contracts", summary.get("total_contracts", 0))
@@ -13,12 +13,11 @@ def format_number(num: float, decimals: int = 2) -> str:
 def format_percentage(num: float, decimals: int = 1) -> str:
     return f"{num:.{decimals}f}%"
 
-def format_bytes(bytes: int) -> str:
-    for unit in ['B', 'KB', 'MB', 'GB']:
-        if bytes < 1024:
-            return f"{bytes:.2f} {unit}"
-        bytes /= 1024
-    return f"{bytes:.2f} TB"
+BYTE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
+def format_bytes(num_bytes: int) -> str:
+    unit = min(max((int(num_bytes).bit_length() - 1) // 10, 0), len(BYTE_UNITS) - 1)
+    return f"{num_bytes / (1 << (10 * unit)):.2f} {BYTE_UNITS[unit]}"
 
 def truncate_text(text: str, length: int = 50) -> str:
     return text[:length] + "..." if len(text) > length else text
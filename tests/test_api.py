@@ -41,3 +41,13 @@ def test_docs_accessible():
 def test_redoc_accessible():
     response = client.get("/redoc")
     assert response.status_code == 200
+
+
+def test_create_app_disables_docs_in_production():
+    from app.config import Settings
+    from app.main import create_app
+
+    prod_client = TestClient(create_app(Settings(ENV="production")))
+
+    assert prod_client.get("/openapi.json").status_code == 404
+    assert prod_client.get("/").status_code == 200
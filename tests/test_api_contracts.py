@@ -275,4 +275,30 @@ schema:
         }
     )
     
-    assert response.status_code == 409
\ No newline at end of file
+    assert response.status_code == 409
+
+def test_export_contract_api():
+    unique_name = f"export-test-contract-{uuid.uuid4().hex[:8]}"
+    yaml_content = """
+contract_version: "1.0"
+domain: "test"
+schema:
+  user_id:
+    type: string
+    required: true
+"""
+    create_response = client.post(
+        "/api/v1/contracts",
+        json={"name": unique_name, "domain": "test", "yaml_content": yaml_content},
+    )
+    contract_id = create_response.json()["id"]
+
+    yaml_response = client.get(f"/api/v1/contracts/{contract_id}/export")
+    assert yaml_response.status_code == 200
+    assert yaml_response.text == yaml_content
+
+    json_response = client.get(f"/api/v1/contracts/{contract_id}/export?format=json")
+    assert json_response.status_code == 200
+    data = json_response.json()
+    assert data["contract_version"] == "1.0"
+    assert data["schema"]["user_id"] == {"type": "string", "required": True}
@@ -97,4 +97,32 @@ def test_batch_size_limit(client, db_session, sample_contract_data):
         json={"data": large_batch}
     )
     
-    assert response.status_code == 413
\ No newline at end of file
+    assert response.status_code == 413
+
+def test_validate_batch_file_api(client, db_session, sample_contract_data):
+    from app.core.contract_manager import ContractManager
+    
+    manager = ContractManager(db_session)
+    contract = manager.create_contract(sample_contract_data)
+    
+    response = client.post(
+        f"/api/v1/validate/{contract.id}/batch/file",
+        files={"file": ("data.csv", b"user_id,email\nusr_1,test1@example.com\nusr_2,test2@example.com\n")},
+        data={"file_type": "csv"}
+    )
+    
+    assert response.status_code == 200
+    result = response.json()
+    assert result["total_records"] == 2
+    assert result["passed"] == 2
+
+def test_validate_batch_file_unknown_contract(client):
+    from uuid import uuid4
+    
+    response = client.post(
+        f"/api/v1/validate/{uuid4()}/batch/file",
+        files={"file": ("data.csv", b"user_id\nusr_1\n")},
+        data={"file_type": "csv"}
+    )
+    
+    assert response.status_code == 404
@@ -124,6 +124,38 @@ schema:
     assert len(contracts) >= 1
 
 
+def test_list_contracts_does_not_lazy_load_relationships(test_db, sample_contract_data):
+    from sqlalchemy.exc import InvalidRequestError
+
+    manager = ContractManager(test_db)
+
+    manager.create_contract(sample_contract_data)
+    test_db.expunge_all()
+
+    contracts, _ = manager.list_contracts()
+
+    with pytest.raises(InvalidRequestError):
+        contracts[0].versions
+
+
+def test_contract_list_adapter_reads_orm_objects(test_db, sample_contract_data):
+    from app.models.schemas import CONTRACT_LIST_ADAPTER
+
+    manager = ContractManager(test_db)
+
+    contract_data = sample_contract_data.model_copy(
+        update={"name": "adapter-contract", "domain": "adapter"}
+    )
+
+    contract = manager.create_contract(contract_data)
+    contracts, _ = manager.list_contracts(domain="adapter")
+
+    responses = CONTRACT_LIST_ADAPTER.validate_python(contracts, from_attributes=True)
+
+    assert [r.id for r in responses] == [contract.id]
+    assert responses[0].yaml_content == contract_data.yaml_content
+
+
 def test_list_contracts_with_domain_filter(test_db):
     manager = ContractManager(test_db)
     
@@ -263,4 +295,42 @@ schema:
     
     activated = manager.activate_contract(contract_uuid)
     
-    assert activated.is_active == True
\ No newline at end of file
+    assert activated.is_active == True
+
+def test_get_contract_with_schema(db_session, sample_contract_data):
+    manager = ContractManager(db_session)
+    created = manager.create_contract(sample_contract_data)
+
+    contract, schema = manager.get_contract_with_schema(created.id)
+    assert contract.id == created.id
+    assert "user_id" in schema.schema
+
+    _, schema_again = manager.get_contract_with_schema(created.id)
+    assert schema_again == schema
+    assert schema_again is not schema
+
+
+def test_get_contract_with_schema_not_found(db_session):
+    manager = ContractManager(db_session)
+
+    assert manager.get_contract_with_schema(uuid.uuid4()) is None
+
+
+def test_list_contract_summaries(test_db, sample_contract_data):
+    from app.models.schemas import ContractSummary
+
+    manager = ContractManager(test_db)
+
+    contract_data = sample_contract_data.model_copy(
+        update={"name": "summary-contract", "domain": "summaries"}
+    )
+
+    contract = manager.create_contract(contract_data)
+
+    summaries, total = manager.list_contract_summaries(domain="summaries")
+
+    assert total == 1
+    summary = ContractSummary.model_validate(summaries[0])
+    assert summary.id == contract.id
+    assert summary.name == "summary-contract"
+    assert not hasattr(summaries[0], "yaml_content")
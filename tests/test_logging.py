@@ -1,4 +1,5 @@
 import logging
+import logging.handlers
 from pathlib import Path
 from app.utils.logging import setup_logging, get_logger
 
@@ -36,3 +37,14 @@ def test_log_file_created():
 
     log_files = list(log_dir.glob("*.log"))
     assert len(log_files) > 0
+
+
+def test_setup_logging_routes_through_single_queue_handler():
+    setup_logging("INFO")
+    setup_logging("INFO")
+
+    root_logger = logging.getLogger()
+    queue_handlers = [
+        h for h in root_logger.handlers if isinstance(h, logging.handlers.QueueHandler)
+    ]
+    assert len(queue_handlers) == 1
@@ -36,4 +36,48 @@ class TestMetricsAggregator:
         trend = aggregator.get_trend_data(sample_contract.id, days=7)
         
         assert trend.days == 7
-        assert trend.pass_rate_trend in ['INCREASING', 'DECREASING', 'STABLE']
\ No newline at end of file
+        assert trend.pass_rate_trend in ['INCREASING', 'DECREASING', 'STABLE']
+
+def test_calculate_daily_metrics_aggregates_in_sql(test_db):
+    from datetime import datetime
+    from app.models.database import Contract, ValidationResult
+
+    contract = Contract(
+        name="metrics-contract",
+        version="1.0.0",
+        domain="test",
+        yaml_content="contract_version: '1.0'",
+        is_active=True,
+    )
+    test_db.add(contract)
+    test_db.commit()
+
+    today = datetime.combine(date.today(), datetime.min.time())
+    rows = [
+        ("PASS", None, 10.0),
+        ("PASS", None, 20.0),
+        ("FAIL", [{"error_type": "TYPE_MISMATCH"}, {"error_type": "PATTERN"}], 30.0),
+        ("FAIL", [{"error_type": "TYPE_MISMATCH"}], 40.0),
+    ]
+    for i, (status, errors, ms) in enumerate(rows):
+        test_db.add(
+            ValidationResult(
+                contract_id=contract.id,
+                status=status,
+                errors=errors,
+                execution_time_ms=ms,
+                validated_at=today + timedelta(hours=i + 1),
+            )
+        )
+    test_db.commit()
+
+    metrics = MetricsAggregator(test_db).calculate_daily_metrics(
+        contract_id=contract.id, target_date=date.today()
+    )
+
+    assert metrics.total_validations == 4
+    assert metrics.passed == 2
+    assert metrics.failed == 2
+    assert metrics.pass_rate == 50.0
+    assert metrics.avg_execution_time_ms == 25.0
+    assert metrics.top_errors == {"TYPE_MISMATCH": 2, "PATTERN": 1}
@@ -0,0 +1,45 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.utils.middleware import ETagMiddleware
+
+
+def _make_client() -> TestClient:
+    app = FastAPI()
+    app.add_middleware(ETagMiddleware)
+
+    @app.get("/items")
+    def list_items():
+        return {"items": [1, 2, 3]}
+
+    @app.post("/items")
+    def create_item():
+        return {"created": True}
+
+    return TestClient(app)
+
+
+def test_etag_returns_not_modified_for_matching_request():
+    client = _make_client()
+
+    response = client.get("/items")
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+    assert etag.startswith('W/"')
+
+    cached = client.get("/items", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+    assert cached.headers["etag"] == etag
+
+    stale = client.get("/items", headers={"If-None-Match": 'W/"stale"'})
+    assert stale.status_code == 200
+    assert stale.json() == {"items": [1, 2, 3]}
+
+
+def test_etag_skips_non_get_requests():
+    client = _make_client()
+
+    response = client.post("/items")
+    assert response.status_code == 200
+    assert "etag" not in response.headers
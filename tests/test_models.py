@@ -177,6 +177,9 @@ def test_validation_result_with_errors(test_db):
     assert result.is_pass() == False
     assert result.error_count() == 2
 
+    row = test_db.query(*ValidationResult.__table__.columns).one()
+    assert ValidationResult.row_to_dict(row) == result.to_dict()
+
 
 def test_create_quality_metric(test_db):
     contract = Contract(
@@ -270,4 +273,45 @@ def test_cascade_delete_contract(test_db):
     
     assert test_db.query(Contract).filter_by(id=contract_id).first() is None
     assert test_db.query(ContractVersion).filter_by(contract_id=contract_id).count() == 0
-    assert test_db.query(ValidationResult).filter_by(contract_id=contract_id).count() == 0
\ No newline at end of file
+    assert test_db.query(ValidationResult).filter_by(contract_id=contract_id).count() == 0
+
+def test_batch_validation_result_top_errors():
+    from app.models.schemas import BatchValidationResult
+
+    result = BatchValidationResult(
+        total_records=10,
+        passed=4,
+        failed=6,
+        pass_rate=40.0,
+        execution_time_ms=1.0,
+        errors_summary={"TYPE_MISMATCH": 2, "REQUIRED_FIELD": 5, "PATTERN": 2},
+        sample_errors=[],
+        batch_id="batch-1",
+    )
+
+    assert result.get_top_errors(2) == [("REQUIRED_FIELD", 5), ("TYPE_MISMATCH", 2)]
+    assert len(result.get_top_errors()) == 3
+
+
+def test_timestamps_default_on_raw_insert(test_db):
+    from sqlalchemy import text
+
+    test_db.execute(
+        text(
+            "INSERT INTO contracts (id, name, version, domain, yaml_content, is_active) "
+            "VALUES ('raw-insert', 'raw-insert-contract', '1.0.0', 'test', 'x', 1)"
+        )
+    )
+
+    contract = test_db.query(Contract).filter_by(id="raw-insert").one()
+    assert isinstance(contract.created_at, datetime)
+    assert isinstance(contract.updated_at, datetime)
+
+
+def test_uuid7_is_time_ordered():
+    from app.models.database import uuid7
+
+    ids = [uuid7() for _ in range(50)]
+
+    assert all(u.version == 7 for u in ids)
+    assert [u.int >> 80 for u in ids] == sorted(u.int >> 80 for u in ids)
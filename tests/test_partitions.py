@@ -0,0 +1,25 @@
+from datetime import date, datetime
+
+from app.core.partitions import (
+    add_months,
+    drop_expired_partitions,
+    ensure_partitions,
+    month_start,
+    partition_name,
+)
+
+
+def test_month_arithmetic():
+    assert month_start(date(2025, 3, 17)) == date(2025, 3, 1)
+    assert add_months(date(2025, 11, 1), 1) == date(2025, 12, 1)
+    assert add_months(date(2025, 11, 1), 3) == date(2026, 2, 1)
+    assert add_months(date(2025, 1, 1), -1) == date(2024, 12, 1)
+
+
+def test_partition_name():
+    assert partition_name(date(2025, 2, 1)) == "validation_results_2025_02"
+
+
+def test_partition_maintenance_skips_non_postgres(test_engine):
+    assert ensure_partitions(test_engine) == []
+    assert drop_expired_partitions(test_engine, datetime.utcnow()) == []
@@ -151,4 +151,25 @@ def test_quality_score_calculation():
     
     result = validator.validate(data)
     assert result.quality_score < 100
-    assert result.quality_score >= 0
\ No newline at end of file
+    assert result.quality_score >= 0
+
+def test_statistics_skip_missing_and_non_numeric_values():
+    rules = {
+        "statistics": {"age": {"mean": {"max": 30}, "std_dev": {"max": 1}}},
+    }
+
+    validator = QualityValidator(rules)
+
+    data = [
+        {"user_id": "usr_1", "age": 20},
+        {"user_id": "usr_2", "age": 60},
+        {"user_id": "usr_3", "age": None},
+        {"user_id": "usr_4", "age": "old"},
+        {"user_id": "usr_5"},
+    ]
+
+    result = validator.validate(data)
+
+    assert [e.rule_type for e in result.errors] == ["STATISTICS", "STATISTICS"]
+    assert result.errors[0].details["mean"] == pytest.approx(40.0)
+    assert result.errors[1].details["std_dev"] == pytest.approx(20.0)
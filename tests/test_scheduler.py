@@ -0,0 +1,34 @@
+from datetime import datetime, timedelta
+
+from app.models.database import Contract, ValidationResult
+from app.utils.scheduler import delete_expired_validation_results
+
+
+def test_delete_expired_validation_results_in_batches(test_db):
+    contract = Contract(
+        name="cleanup-contract",
+        version="1.0.0",
+        domain="test",
+        yaml_content="contract_version: '1.0'\nschema: {}",
+    )
+    test_db.add(contract)
+    test_db.commit()
+
+    now = datetime.utcnow()
+    for days_old in [100, 95, 91, 92, 5]:
+        test_db.add(
+            ValidationResult(
+                contract_id=contract.id,
+                status="PASS",
+                execution_time_ms=1.0,
+                validated_at=now - timedelta(days=days_old),
+            )
+        )
+    test_db.commit()
+
+    cutoff = now - timedelta(days=90)
+    assert delete_expired_validation_results(test_db, cutoff, batch_size=2) == 4
+
+    remaining = test_db.query(ValidationResult).all()
+    assert len(remaining) == 1
+    assert remaining[0].validated_at >= cutoff
@@ -53,6 +53,16 @@ def test_validate_missing_required_field(simple_schema):
     assert len(errors) == 1
     assert errors[0].error_type == "REQUIRED_FIELD_MISSING"
     assert errors[0].field == "email"
+    assert errors[0].value is None
+
+
+def test_validate_required_null_keeps_string_value(simple_schema):
+    validator = SchemaValidator(simple_schema)
+    
+    errors = validator.validate({"user_id": "usr_123", "email": None})
+    assert len(errors) == 1
+    assert errors[0].error_type == "TYPE_MISMATCH"
+    assert errors[0].value == "None"
 
 
 def test_validate_type_mismatch(simple_schema):
@@ -172,4 +182,68 @@ def test_validate_array():
     
     errors = validator.validate(data)
     assert len(errors) == 1
-    assert "items[1]" in errors[0].field
\ No newline at end of file
+    assert "items[1]" in errors[0].field
+
+def test_validate_raw_defers_error_rendering(simple_schema):
+    from app.core.schema_validator import to_validation_error
+
+    validator = SchemaValidator(simple_schema)
+
+    raw_errors = validator.validate_raw(
+        {"user_id": "usr_123", "email": "test@example.com", "age": -5}
+    )
+    assert raw_errors == [("age", "VALUE_TOO_SMALL", -5, simple_schema.schema["age"])]
+
+    error = to_validation_error(raw_errors[0])
+    assert error.message == "Value -5 is less than minimum 0"
+    assert error.value == "-5"
+    assert error.expected == "min: 0"
+
+
+def test_validate_timestamp_bounds():
+    schema = ContractSchema(
+        contract_version="1.0",
+        domain="test",
+        schema={
+            "created_at": FieldDefinition(
+                type="timestamp",
+                required=True,
+                min="2024-01-01T00:00:00Z",
+                max="2024-12-31T23:59:59Z",
+            )
+        },
+    )
+
+    validator = SchemaValidator(schema)
+
+    assert validator.validate({"created_at": "2024-06-01T12:00:00Z"}) == []
+
+    errors = validator.validate({"created_at": "2023-06-01T12:00:00Z"})
+    assert len(errors) == 1
+    assert errors[0].error_type == "TIMESTAMP_TOO_OLD"
+
+    errors = validator.validate({"created_at": "not-a-date"})
+    assert len(errors) == 1
+    assert errors[0].error_type == "INVALID_TIMESTAMP"
+
+
+
+def test_invalid_timestamp_min_keeps_max_bound():
+    schema = ContractSchema(
+        contract_version="1.0",
+        domain="test",
+        schema={
+            "created_at": FieldDefinition(
+                type="timestamp",
+                required=True,
+                min="not-a-date",
+                max="2024-12-31T23:59:59Z",
+            )
+        },
+    )
+
+    validator = SchemaValidator(schema)
+
+    errors = validator.validate({"created_at": "2025-06-01T12:00:00Z"})
+    assert len(errors) == 1
+    assert errors[0].error_type == "TIMESTAMP_TOO_RECENT"
@@ -80,6 +80,7 @@ schema:
     # One field removed = 15 points = LOW risk
     assert version.change_summary["risk_level"] == "LOW"
     assert version.change_summary["risk_score"] == 15
+    assert version.total_changes == version.change_summary["total_changes"]
 
 
 def test_create_version_with_non_breaking_change(version_controller, sample_contract):
@@ -155,6 +156,13 @@ def test_version_number_calculation(version_controller):
     assert new_version == "1.2.4"
 
 
+def test_parse_semver():
+    from app.core.version_controller import VersionController
+
+    assert VersionController._parse_semver("1.2.3") == (1, 2, 3)
+    assert VersionController._parse_semver("2.5") == (2, 5, 0)
+
+
 def test_get_version_history(version_controller, sample_contract):
     new_yaml = """
 contract_version: "1.0"
@@ -1,5 +1,6 @@
+import orjson
 import pytest
-from app.core.yaml_parser import YAMLParser, YAMLSyntaxError, MissingRequiredKeyError, InvalidSchemaError
+from app.core.yaml_parser import YAMLParser, YAMLSyntaxError, MissingRequiredKeyError, InvalidSchemaError, parse_cache, compile_pattern, serialize_cache
 
 
 def test_parse_valid_yaml():
@@ -118,4 +119,77 @@ schema:
     
     assert "contract_version" in serialized
     assert "schema" in serialized
-    assert "user_id" in serialized
\ No newline at end of file
+    assert "user_id" in serialized
+
+def test_parse_yaml_cache_returns_copies():
+    yaml_content = """
+contract_version: "1.0"
+domain: "cached"
+schema:
+  user_id:
+    type: string
+"""
+    parser = YAMLParser()
+    parse_cache.clear()
+
+    first = parser.parse_yaml(yaml_content)
+    first.schema["user_id"].required = False
+    second = parser.parse_yaml(yaml_content)
+
+    assert second.schema["user_id"].required is True
+    assert parse_cache.stats()["hits"] == 1
+    assert parse_cache.stats()["misses"] == 1
+
+
+def test_compile_pattern_reuses_compiled_regex():
+    assert compile_pattern(r"^usr_\d+$") is compile_pattern(r"^usr_\d+$")
+
+
+
+def test_serialize_to_yaml_is_cached():
+    yaml_content = """
+contract_version: "1.0"
+domain: "serialized"
+schema:
+  user_id:
+    type: string
+"""
+    parser = YAMLParser()
+    schema = parser.parse_yaml(yaml_content)
+    serialize_cache.clear()
+
+    first = parser.serialize_to_yaml(schema)
+    second = parser.serialize_to_yaml(parser.parse_yaml(yaml_content))
+
+    assert first == second
+    assert serialize_cache.stats()["hits"] == 1
+
+    schema.schema["user_id"].required = False
+    assert parser.serialize_to_yaml(schema) != first
+
+
+def test_serialize_to_json_matches_yaml_export():
+    yaml_content = """
+contract_version: "1.0"
+domain: "test"
+schema:
+  user_id:
+    type: string
+    pattern: "^usr_"
+  age:
+    type: integer
+    min: 0
+"""
+    parser = YAMLParser()
+    schema = parser.parse_yaml(yaml_content)
+
+    exported = orjson.loads(parser.serialize_to_json(schema))
+    from_yaml = parser.parse_yaml(parser.serialize_to_yaml(schema))
+
+    assert exported["schema"]["user_id"] == {
+        "type": "string",
+        "required": True,
+        "pattern": "^usr_",
+    }
+    assert exported["schema"]["age"]["min"] == 0
+    assert exported == orjson.loads(parser.serialize_to_json(from_yaml))